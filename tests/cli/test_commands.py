@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from vibe.cli.commands import CommandRegistry
+
+
+@pytest.fixture
+def commands_dir(tmp_path: Path) -> Path:
+    commands = tmp_path / "commands"
+    commands.mkdir()
+    return commands
+
+
+def test_help_text_lists_builtin_commands(commands_dir: Path) -> None:
+    registry = CommandRegistry(commands_dir=commands_dir)
+
+    help_text = registry.get_help_text()
+
+    assert "### Built-in Commands" in help_text
+    assert "- `/config`, `/model`, `/theme`: Edit config settings" in help_text
+    assert "### Custom Commands" not in help_text
+
+
+def test_help_text_is_computed_once(commands_dir: Path) -> None:
+    registry = CommandRegistry(commands_dir=commands_dir)
+
+    assert registry.get_help_text() is registry.get_help_text()
+
+
+def test_help_text_omits_excluded_commands(commands_dir: Path) -> None:
+    registry = CommandRegistry(excluded_commands=["exit"], commands_dir=commands_dir)
+
+    assert "`/exit`" not in registry.get_help_text()
+
+
+def test_find_command_matches_alias_case_and_whitespace_insensitively(
+    commands_dir: Path,
+) -> None:
+    registry = CommandRegistry(commands_dir=commands_dir)
+
+    assert registry.find_command("/help") is registry.commands["help"]
+    assert registry.find_command("  /THEME \n") is registry.commands["config"]
+
+
+def test_find_command_ignores_plain_text(commands_dir: Path) -> None:
+    registry = CommandRegistry(commands_dir=commands_dir)
+
+    assert registry.find_command("") is None
+    assert registry.find_command("help") is None
+    assert registry.find_command("/unknown") is None
+
+
+def test_find_command_rejects_input_longer_than_any_alias(commands_dir: Path) -> None:
+    registry = CommandRegistry(commands_dir=commands_dir)
+
+    assert registry.find_command("/help me understand this traceback") is None
+
+
+def test_custom_commands_are_listed_separately(commands_dir: Path) -> None:
+    (commands_dir / "deploy.toml").write_text(
+        "[command]\n"
+        'name = "deploy"\n'
+        'aliases = ["/deploy", "/ship"]\n'
+        'description = "Deploy the app"\n'
+        'type = "bash"\n'
+        'command = "make deploy"\n'
+    )
+    registry = CommandRegistry(commands_dir=commands_dir)
+
+    help_text = registry.get_help_text()
+    builtin_section, custom_section = help_text.split("### Custom Commands")
+
+    assert "/deploy" not in builtin_section
+    assert "- `/deploy`, `/ship`: Deploy the app" in custom_section
+    assert registry.find_command("/ship") is registry.commands["deploy"]
+    assert registry.commands["deploy"].is_custom
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import random
+
+from vibe.cli.textual_ui.widgets.sparkline import Sparkline
+
+
+def test_renders_peak_as_top_block():
+    sparkline = Sparkline([1.596, 3.57, 18.0, 98.93, 47.81], max_points=5)
+
+    assert sparkline.render() == "▁▁▂█▄"
+
+
+def test_peak_always_reaches_top_block():
+    rng = random.Random(0)
+    for _ in range(2000):
+        data = [rng.uniform(0, 100) for _ in range(10)]
+        sparkline = Sparkline(data, max_points=10)
+
+        rendered = sparkline.render()
+
+        assert rendered[data.index(max(data))] == "█"
+        assert rendered[data.index(min(data))] == "▁"
+
+
+def test_left_pads_to_max_points():
+    sparkline = Sparkline([1.0, 2.0], max_points=4)
+
+    assert sparkline.render() == "  ▁█"
@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from vibe.core.custom_commands import (
+    CACHE_FILE_NAME,
+    CustomCommandDefinition,
+    CustomCommandExecutor,
+    CustomCommandLoader,
+    HandlerKind,
+    create_custom_command_handler,
+)
+
+
+@pytest.fixture
+def commands_dir(tmp_path: Path) -> Path:
+    commands = tmp_path / "commands"
+    commands.mkdir()
+    return commands
+
+
+def write_command(commands_dir: Path, name: str, **fields: str) -> Path:
+    fields.setdefault("description", f"Run {name}")
+    fields.setdefault("type", "bash")
+    fields.setdefault("command", f"echo {name}")
+    body = "\n".join(f'{key} = "{value}"' for key, value in fields.items())
+    path = commands_dir / f"{name}.toml"
+    path.write_text(f'[command]\nname = "{name}"\n{body}\n')
+    return path
+
+
+class TestCustomCommandLoader:
+    def test_returns_empty_when_directory_is_missing(self, tmp_path: Path) -> None:
+        loader = CustomCommandLoader(tmp_path / "missing")
+
+        assert loader.load_commands() == {}
+
+    def test_loads_toml_definitions(self, commands_dir: Path) -> None:
+        write_command(commands_dir, "deploy", command="make deploy")
+        (commands_dir / "notes.txt").write_text("not a command")
+
+        commands = CustomCommandLoader(commands_dir).load_commands()
+
+        assert list(commands) == ["deploy"]
+        assert commands["deploy"].aliases == ["/deploy"]
+        assert commands["deploy"].handler == "make deploy"
+        assert commands["deploy"].kind is HandlerKind.BASH
+
+    def test_skips_files_without_command_section(self, commands_dir: Path) -> None:
+        (commands_dir / "empty.toml").write_text("")
+        (commands_dir / "other.toml").write_text('[settings]\nname = "x"\n')
+
+        assert CustomCommandLoader(commands_dir).load_commands() == {}
+
+    def test_does_not_parse_files_without_command_key(self, commands_dir: Path) -> None:
+        (commands_dir / "other.toml").write_text('[settings]\nname = "command"\n')
+
+        with patch("tomllib.loads", side_effect=AssertionError):
+            assert CustomCommandLoader(commands_dir).load_commands() == {}
+
+    @pytest.mark.parametrize(
+        "source",
+        [
+            '["command"]\nname = "deploy"\ndescription = "Run deploy"\ntype = "bash"',
+            "['command']\nname = 'deploy'\ndescription = 'Run deploy'\ntype = 'bash'",
+            '"command" = {name = "deploy", description = "Run deploy", type = "bash"}',
+        ],
+    )
+    def test_loads_quoted_command_key(self, commands_dir: Path, source: str) -> None:
+        (commands_dir / "deploy.toml").write_text(f"{source}\n")
+
+        commands = CustomCommandLoader(commands_dir).load_commands()
+
+        assert commands["deploy"].description == "Run deploy"
+
+    def test_reuses_parse_of_unchanged_files(self, commands_dir: Path) -> None:
+        write_command(commands_dir, "deploy")
+        loader = CustomCommandLoader(commands_dir)
+        first = loader.load_commands()
+
+        with patch.object(
+            CustomCommandLoader, "_load_command_file", side_effect=AssertionError
+        ):
+            second = loader.load_commands()
+
+        assert second["deploy"] is first["deploy"]
+
+    def test_reparses_modified_files(self, commands_dir: Path) -> None:
+        write_command(commands_dir, "deploy", description="Old")
+        loader = CustomCommandLoader(commands_dir)
+        assert loader.load_commands()["deploy"].description == "Old"
+
+        write_command(commands_dir, "deploy", description="Newer")
+
+        assert loader.load_commands()["deploy"].description == "Newer"
+
+    def test_reuses_disk_cache_in_a_fresh_process(
+        self, commands_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        write_command(commands_dir, "deploy")
+        CustomCommandLoader(commands_dir).load_commands()
+        assert (commands_dir / CACHE_FILE_NAME).is_file()
+
+        monkeypatch.setattr(CustomCommandLoader, "_parse_cache", {})
+        monkeypatch.setattr(CustomCommandLoader, "_disk_caches", {})
+        with patch.object(
+            CustomCommandLoader, "_load_command_file", side_effect=AssertionError
+        ):
+            commands = CustomCommandLoader(commands_dir).load_commands()
+
+        assert commands["deploy"].handler == "echo deploy"
+
+    def test_ignores_disk_cache_with_unknown_fields(
+        self, commands_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        path = write_command(commands_dir, "deploy")
+        CustomCommandLoader(commands_dir).load_commands()
+        cache_file = commands_dir / CACHE_FILE_NAME
+        cache = json.loads(cache_file.read_text())
+        cache["entries"][str(path)][1]["unexpected"] = True
+        cache_file.write_text(json.dumps(cache))
+        monkeypatch.setattr(CustomCommandLoader, "_parse_cache", {})
+        monkeypatch.setattr(CustomCommandLoader, "_disk_caches", {})
+
+        commands = CustomCommandLoader(commands_dir).load_commands()
+
+        assert commands["deploy"].handler == "echo deploy"
+        assert (
+            "unexpected"
+            not in json.loads(cache_file.read_text())["entries"][str(path)][1]
+        )
+
+    def test_ignores_corrupt_disk_cache(
+        self, commands_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        write_command(commands_dir, "deploy")
+        (commands_dir / CACHE_FILE_NAME).write_text("not json")
+        monkeypatch.setattr(CustomCommandLoader, "_parse_cache", {})
+        monkeypatch.setattr(CustomCommandLoader, "_disk_caches", {})
+
+        commands = CustomCommandLoader(commands_dir).load_commands()
+
+        assert list(commands) == ["deploy"]
+
+
+class TestCustomCommandExecutor:
+    @pytest.mark.asyncio
+    async def test_runs_bash_command_in_workdir(self, tmp_path: Path) -> None:
+        executor = CustomCommandExecutor(workdir=tmp_path)
+
+        stdout, stderr, returncode = await executor.execute_bash_command(
+            "pwd; echo oops >&2; exit 3"
+        )
+
+        assert stdout.strip() == str(tmp_path)
+        assert stderr.strip() == "oops"
+        assert returncode == 3
+
+    @pytest.mark.asyncio
+    async def test_reports_timeout(self, tmp_path: Path) -> None:
+        executor = CustomCommandExecutor(workdir=tmp_path)
+
+        result = await executor.execute_bash_command("sleep 5", timeout=1)
+
+        assert result == ("", "Command timed out after 1s", 124)
+
+
+class TestCreateCustomCommandHandler:
+    @pytest.mark.asyncio
+    async def test_bash_handler_runs_command(self, tmp_path: Path) -> None:
+        definition = CustomCommandDefinition(
+            name="hi",
+            aliases=["/hi"],
+            description="",
+            command_type="bash",
+            handler="echo hi",
+        )
+        handler = create_custom_command_handler(
+            definition, CustomCommandExecutor(workdir=tmp_path)
+        )
+
+        result = await handler()
+
+        assert result == {
+            "type": "bash",
+            "stdout": "hi\n",
+            "stderr": "",
+            "returncode": 0,
+            "command": "echo hi",
+        }
+
+    @pytest.mark.asyncio
+    async def test_prompt_handler_returns_stripped_template(
+        self, tmp_path: Path
+    ) -> None:
+        definition = CustomCommandDefinition(
+            name="review",
+            aliases=["/review"],
+            description="",
+            command_type="prompt",
+            handler="  Review this.\n",
+        )
+        handler = create_custom_command_handler(
+            definition, CustomCommandExecutor(workdir=tmp_path)
+        )
+
+        assert await handler() == {"type": "prompt", "text": "Review this."}
+
+    @pytest.mark.asyncio
+    async def test_unsupported_kind_reports_error(self, tmp_path: Path) -> None:
+        definition = CustomCommandDefinition(
+            name="py",
+            aliases=["/py"],
+            description="",
+            command_type="python",
+            handler="f",
+        )
+        handler = create_custom_command_handler(
+            definition, CustomCommandExecutor(workdir=tmp_path)
+        )
+
+        assert await handler() == {
+            "type": "error",
+            "message": "Unknown command type: python",
+        }
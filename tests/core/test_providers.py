@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import pytest
+
+from vibe.core.providers import (
+    PROVIDER_PRESETS,
+    format_provider_list,
+    get_provider_preset,
+    list_provider_presets,
+)
+
+
+def test_get_provider_preset_is_case_insensitive() -> None:
+    assert get_provider_preset("ollama") is PROVIDER_PRESETS["ollama"]
+    assert get_provider_preset("Ollama") is PROVIDER_PRESETS["ollama"]
+    assert get_provider_preset("OLLAMA") is PROVIDER_PRESETS["ollama"]
+    assert get_provider_preset("LmStudio") is PROVIDER_PRESETS["lmstudio"]
+    assert get_provider_preset("unknown") is None
+
+
+def test_presets_are_immutable() -> None:
+    preset = PROVIDER_PRESETS["ollama"]
+
+    with pytest.raises(TypeError):
+        PROVIDER_PRESETS["custom"] = preset  # type: ignore[index]
+    with pytest.raises(AttributeError):
+        preset.api_base = "http://example.com"  # type: ignore[misc]
+
+
+def test_format_provider_list_groups_local_and_remote() -> None:
+    output = format_provider_list(list_provider_presets(), ["groq"])
+
+    local_section, remote_section = output.split("[Remote Providers]")
+
+    assert "ollama" in local_section
+    assert "openai" not in local_section
+    assert "openai" in remote_section
+    assert "groq         - Groq - Ultra-fast inference (configured)" in remote_section
+    assert "Key: $GROQ_API_KEY" in remote_section
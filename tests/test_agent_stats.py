@@ -155,6 +155,17 @@ class TestAgentStatsHelpers:
         # Cost = 1M * $2/M + 0.5M * $4/M = $2 + $2 = $4
         assert stats.session_cost == 4.0
 
+    def test_last_turn_cost_uses_last_turn_tokens(self) -> None:
+        stats = AgentStats(
+            session_prompt_tokens=5_000_000,
+            last_turn_prompt_tokens=1_000_000,
+            last_turn_completion_tokens=250_000,
+            input_price_per_million=1.0,
+            output_price_per_million=4.0,
+        )
+        # Cost = 1M * $1/M + 0.25M * $4/M = $1 + $1 = $2
+        assert stats.last_turn_cost == 2.0
+
 
 class TestReloadPreservesStats:
     @pytest.mark.asyncio
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import pytest
+
+from vibe.core.tools.fs import ExcludeMatcher, format_size
+
+
+@pytest.mark.parametrize(
+    ("name", "excluded"),
+    [
+        (".git", True),
+        ("node_modules", True),
+        ("app.pyc", True),
+        ("mylib.egg-info", True),
+        ("app.py", False),
+        ("git", False),
+        ("node_modules_extra", False),
+    ],
+)
+def test_exclude_matcher(name, excluded):
+    matcher = ExcludeMatcher([".git", "node_modules", "*.pyc", "*.egg-info"])
+
+    assert matcher.matches(name) is excluded
+
+
+def test_exclude_matcher_without_wildcards():
+    matcher = ExcludeMatcher([".git"])
+
+    assert matcher.matches(".git")
+    assert not matcher.matches("src")
+
+
+@pytest.mark.parametrize(
+    ("size", "expected"),
+    [
+        (0, "0B"),
+        (1023, "1023B"),
+        (1024, "1.0KB"),
+        (1536, "1.5KB"),
+        (5 * 1024**2, "5.0MB"),
+        (3 * 1024**3, "3.0GB"),
+        (2048 * 1024**4, "2048.0TB"),
+    ],
+)
+def test_format_size(size, expected):
+    assert format_size(size) == expected
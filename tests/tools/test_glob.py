@@ -0,0 +1,305 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+import re
+import warnings
+
+import pytest
+
+from vibe.core.tools.base import ToolError
+from vibe.core.tools.builtins import glob as glob_module
+from vibe.core.tools.builtins.glob import Glob, GlobArgs, GlobState, GlobToolConfig
+from vibe.core.tools.fs import SCAN_WORKERS
+
+
+@pytest.fixture
+def glob_tool(tmp_path):
+    config = GlobToolConfig(workdir=tmp_path)
+    return Glob(config=config, state=GlobState())
+
+
+@pytest.fixture
+def tree(tmp_path: Path) -> Path:
+    for rel in [
+        "README.md",
+        "setup.py",
+        "src/app.py",
+        "src/util.py",
+        "src/pkg/core.py",
+        "src/pkg/data.json",
+        "tests/test_app.py",
+        "node_modules/lib/index.py",
+        "src/__pycache__/app.cpython-312.pyc",
+        "mylib.egg-info/PKG-INFO",
+        ".hidden/secret.py",
+        "src/.env.py",
+    ]:
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("x" * 10)
+    return tmp_path
+
+
+def paths(result) -> list[str]:
+    return [m.path for m in result.matches]
+
+
+@pytest.mark.asyncio
+async def test_matches_top_level_only_without_double_star(glob_tool, tree):
+    result = await glob_tool.run(GlobArgs(pattern="*.py"))
+
+    assert paths(result) == ["setup.py"]
+    assert result.matches[0].size == 10
+    assert not result.matches[0].is_dir
+
+
+@pytest.mark.asyncio
+async def test_double_star_matches_recursively(glob_tool, tree):
+    result = await glob_tool.run(GlobArgs(pattern="**/*.py"))
+
+    assert paths(result) == [
+        "setup.py",
+        "src/app.py",
+        "src/pkg/core.py",
+        "src/util.py",
+        "tests/test_app.py",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_double_star_under_subdirectory(glob_tool, tree):
+    result = await glob_tool.run(GlobArgs(pattern="src/**/*.py"))
+
+    assert paths(result) == ["src/app.py", "src/pkg/core.py", "src/util.py"]
+
+
+@pytest.mark.asyncio
+async def test_single_star_does_not_cross_directories(glob_tool, tree):
+    result = await glob_tool.run(GlobArgs(pattern="src/*.py"))
+
+    assert paths(result) == ["src/app.py", "src/util.py"]
+
+
+@pytest.mark.asyncio
+async def test_lists_directories_first(glob_tool, tree):
+    result = await glob_tool.run(GlobArgs(pattern="src/*"))
+
+    assert paths(result) == ["src/pkg", "src/app.py", "src/util.py"]
+    assert result.matches[0].is_dir
+    assert result.matches[0].size is None
+
+
+@pytest.mark.asyncio
+async def test_includes_hidden_entries_when_requested(glob_tool, tree):
+    result = await glob_tool.run(GlobArgs(pattern="**/*.py", include_hidden=True))
+
+    assert ".hidden/secret.py" in paths(result)
+    assert "src/.env.py" in paths(result)
+    assert "node_modules/lib/index.py" not in paths(result)
+
+
+@pytest.mark.asyncio
+async def test_skips_hidden_and_excluded_entries_by_default(glob_tool, tree):
+    result = await glob_tool.run(GlobArgs(pattern="**/*"))
+
+    assert not any(
+        part.startswith(".") or part in {"node_modules", "__pycache__"}
+        for path in paths(result)
+        for part in path.split("/")
+    )
+    assert "src/pkg/data.json" in paths(result)
+
+
+@pytest.mark.asyncio
+async def test_excludes_wildcard_patterns(glob_tool, tree):
+    result = await glob_tool.run(GlobArgs(pattern="**/PKG-INFO"))
+
+    assert paths(result) == []
+
+
+@pytest.mark.asyncio
+async def test_searches_from_given_path(glob_tool, tree):
+    result = await glob_tool.run(GlobArgs(pattern="*.py", path="src"))
+
+    assert paths(result) == ["src/app.py", "src/util.py"]
+    assert result.base_path == str(tree / "src")
+
+
+@pytest.mark.asyncio
+async def test_truncates_to_max_matches(tmp_path):
+    for i in range(10):
+        (tmp_path / f"f{i}.txt").write_text("")
+    tool = Glob(
+        config=GlobToolConfig(workdir=tmp_path, max_matches=3), state=GlobState()
+    )
+
+    result = await tool.run(GlobArgs(pattern="*.txt"))
+
+    assert len(result.matches) == 3
+    assert result.was_truncated
+
+
+@pytest.mark.asyncio
+async def test_raises_for_missing_path(glob_tool):
+    with pytest.raises(ToolError, match="does not exist"):
+        await glob_tool.run(GlobArgs(pattern="*", path="missing"))
+
+
+@pytest.mark.asyncio
+async def test_raises_for_file_path(glob_tool, tree):
+    with pytest.raises(ToolError, match="not a directory"):
+        await glob_tool.run(GlobArgs(pattern="*", path="setup.py"))
+
+
+@pytest.mark.asyncio
+async def test_does_not_descend_into_excluded_directories(glob_tool, tree, monkeypatch):
+    opened: list[str] = []
+    real_scandir = os.scandir
+
+    def tracking_scandir(path):
+        opened.append(os.path.relpath(path, tree))
+        return real_scandir(path)
+
+    monkeypatch.setattr(os, "scandir", tracking_scandir)
+
+    await glob_tool.run(GlobArgs(pattern="**/*.py"))
+
+    assert "node_modules" not in opened
+    assert "node_modules/lib" not in opened
+    assert os.path.join("src", "__pycache__") not in opened
+    assert ".hidden" not in opened
+
+
+@pytest.mark.asyncio
+async def test_walk_starts_at_literal_prefix(glob_tool, tree, monkeypatch):
+    opened: list[str] = []
+    real_scandir = os.scandir
+
+    def tracking_scandir(path):
+        opened.append(os.path.relpath(path, tree))
+        return real_scandir(path)
+
+    monkeypatch.setattr(os, "scandir", tracking_scandir)
+
+    result = await glob_tool.run(GlobArgs(pattern="src/pkg/*.py"))
+
+    assert paths(result) == ["src/pkg/core.py"]
+    assert opened == [os.path.join("src", "pkg")]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("pattern", ["*/*.py", "**/*.py"])
+async def test_bounds_read_ahead_of_unreached_directories(
+    tmp_path, monkeypatch, pattern
+):
+    for i in range(30):
+        (tmp_path / f"d{i:02}").mkdir()
+        for j in range(25):
+            (tmp_path / f"d{i:02}" / f"f{j:02}.py").write_text("")
+    tool = Glob(
+        config=GlobToolConfig(workdir=tmp_path, max_matches=10), state=GlobState()
+    )
+    opened: list[str] = []
+    real_scandir = os.scandir
+
+    def tracking_scandir(path):
+        opened.append(os.path.relpath(path, tmp_path))
+        return real_scandir(path)
+
+    monkeypatch.setattr(os, "scandir", tracking_scandir)
+
+    result = await tool.run(GlobArgs(pattern=pattern))
+
+    # The cap is reached inside the first directory walked
+    matched_dirs = {p.split("/")[0] for p in paths(result)}
+    assert len(matched_dirs) == 1
+    assert result.was_truncated
+    # Besides it, at most SCAN_WORKERS - 1 directories are opened ahead
+    assert "." in opened
+    assert matched_dirs <= set(opened)
+    assert len(set(opened) - {"."}) <= SCAN_WORKERS
+
+
+@pytest.mark.asyncio
+async def test_reversed_bracket_range_matches_nothing(glob_tool, tree):
+    result = await glob_tool.run(GlobArgs(pattern="[z-a].py"))
+
+    assert paths(result) == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("pattern", "expected"),
+    [("[s&&x]etup.py", ["setup.py"]), ("[[]x.py", ["[x.py"]), ("[|~]x.py", ["|x.py"])],
+)
+async def test_bracket_set_operators_are_literal(glob_tool, tree, pattern, expected):
+    (tree / "[x.py").write_text("")
+    (tree / "|x.py").write_text("")
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        result = await glob_tool.run(GlobArgs(pattern=pattern))
+
+    assert paths(result) == expected
+
+
+@pytest.mark.asyncio
+async def test_matches_case_insensitively_where_paths_are(glob_tool, tree, monkeypatch):
+    monkeypatch.setattr(glob_module, "_CASE_FLAGS", re.IGNORECASE)
+    glob_module._compile_glob.cache_clear()
+    try:
+        result = await glob_tool.run(GlobArgs(pattern="*.PY"))
+    finally:
+        glob_module._compile_glob.cache_clear()
+
+    assert paths(result) == ["setup.py"]
+
+
+@pytest.mark.asyncio
+async def test_excluded_literal_prefix_matches_nothing(glob_tool, tree):
+    result = await glob_tool.run(GlobArgs(pattern="node_modules/**/*.py"))
+
+    assert paths(result) == []
+
+
+@pytest.mark.asyncio
+async def test_follows_symlinked_directories_only_for_bounded_patterns(glob_tool, tree):
+    (tree / "link").symlink_to(tree / "src", target_is_directory=True)
+
+    bounded = await glob_tool.run(GlobArgs(pattern="*/*.py"))
+    unbounded = await glob_tool.run(GlobArgs(pattern="**/*.py"))
+
+    assert "link/app.py" in paths(bounded)
+    assert "src/app.py" in paths(unbounded)
+    assert not any(p.startswith("link/") for p in paths(unbounded))
+
+
+@pytest.mark.asyncio
+async def test_follows_symlinks_in_literal_prefix(glob_tool, tree):
+    (tree / "link").symlink_to(tree / "src", target_is_directory=True)
+    (tree / "src" / "lnk").symlink_to(tree / "src" / "pkg", target_is_directory=True)
+
+    assert paths(await glob_tool.run(GlobArgs(pattern="link/*.py"))) == [
+        "link/app.py",
+        "link/util.py",
+    ]
+    assert paths(await glob_tool.run(GlobArgs(pattern="src/lnk/*.py"))) == [
+        "src/lnk/core.py"
+    ]
+    assert paths(await glob_tool.run(GlobArgs(pattern="link/app.py"))) == [
+        "link/app.py"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_reports_absolute_paths_outside_workdir(tmp_path, tree):
+    workdir = tmp_path / "tests"
+    tool = Glob(config=GlobToolConfig(workdir=workdir), state=GlobState())
+
+    result = await tool.run(GlobArgs(pattern="*.py", path=str(tree / "src")))
+
+    assert paths(result) == [
+        os.path.join(tree, "src", "app.py"),
+        os.path.join(tree, "src", "util.py"),
+    ]
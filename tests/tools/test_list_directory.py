@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from vibe.core.tools.base import ToolError
+from vibe.core.tools.builtins.list_directory import (
+    ListDirectory,
+    ListDirectoryArgs,
+    ListDirectoryConfig,
+    ListDirectoryState,
+)
+from vibe.core.tools.fs import SCAN_WORKERS
+
+
+@pytest.fixture
+def list_dir(tmp_path):
+    config = ListDirectoryConfig(workdir=tmp_path)
+    return ListDirectory(config=config, state=ListDirectoryState())
+
+
+@pytest.fixture
+def tree(tmp_path: Path) -> Path:
+    for rel in [
+        "README.md",
+        "b.txt",
+        "Alpha.txt",
+        "src/app.py",
+        "src/app.pyc",
+        "src/pkg/core.py",
+        "docs/index.md",
+        "node_modules/lib/index.js",
+        ".hidden/secret.txt",
+        ".env",
+    ]:
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("x" * 10)
+    return tmp_path
+
+
+def paths(result) -> list[str]:
+    return [e.path for e in result.entries]
+
+
+@pytest.mark.asyncio
+async def test_lists_directories_first_then_files_by_name(list_dir, tree):
+    result = await list_dir.run(ListDirectoryArgs())
+
+    assert paths(result) == ["docs", "src", "Alpha.txt", "b.txt", "README.md"]
+    assert result.path == str(tree)
+    assert result.total_entries == 5
+    assert not result.was_truncated
+
+
+@pytest.mark.asyncio
+async def test_reports_entry_metadata(list_dir, tree):
+    result = await list_dir.run(ListDirectoryArgs())
+    by_path = {e.path: e for e in result.entries}
+
+    assert by_path["src"].is_dir
+    assert by_path["src"].size is None
+    assert by_path["src"].children_count is None
+    assert not by_path["b.txt"].is_dir
+    assert by_path["b.txt"].size == 10
+    assert by_path["b.txt"].modified is not None
+    assert by_path["b.txt"].modified.endswith("+00:00")
+
+
+@pytest.mark.asyncio
+async def test_counts_children_only_when_requested(list_dir, tree):
+    result = await list_dir.run(ListDirectoryArgs(count_children=True))
+    recursive = await list_dir.run(
+        ListDirectoryArgs(count_children=True, recursive=True)
+    )
+
+    assert {e.path: e.children_count for e in result.entries if e.is_dir} == {
+        "docs": 1,
+        "src": 3,
+    }
+    assert all(e.children_count is None for e in recursive.entries)
+
+
+@pytest.mark.asyncio
+async def test_includes_hidden_entries_when_requested(list_dir, tree):
+    result = await list_dir.run(ListDirectoryArgs(include_hidden=True))
+
+    assert paths(result)[0] == ".hidden"
+    assert ".env" in paths(result)
+
+
+@pytest.mark.asyncio
+async def test_lists_recursively_up_to_max_depth(list_dir, tree):
+    result = await list_dir.run(ListDirectoryArgs(recursive=True, max_depth=1))
+
+    assert paths(result) == [
+        "docs",
+        "docs/index.md",
+        "src",
+        "src/pkg",
+        "src/app.py",
+        "Alpha.txt",
+        "b.txt",
+        "README.md",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_lists_path_relative_to_workdir(list_dir, tree):
+    result = await list_dir.run(ListDirectoryArgs(path="src"))
+
+    assert paths(result) == ["src/pkg", "src/app.py"]
+    assert result.path == str(tree / "src")
+
+
+@pytest.mark.asyncio
+async def test_reports_absolute_paths_outside_workdir(tmp_path, tree):
+    tool = ListDirectory(
+        config=ListDirectoryConfig(workdir=tmp_path / "docs"),
+        state=ListDirectoryState(),
+    )
+
+    result = await tool.run(ListDirectoryArgs(path=str(tree / "src")))
+
+    assert paths(result) == [str(tree / "src" / "pkg"), str(tree / "src" / "app.py")]
+
+
+@pytest.mark.asyncio
+async def test_truncates_to_max_entries(tmp_path):
+    for i in range(10):
+        (tmp_path / f"f{i}.txt").write_text("")
+    tool = ListDirectory(
+        config=ListDirectoryConfig(workdir=tmp_path, max_entries=3),
+        state=ListDirectoryState(),
+    )
+
+    result = await tool.run(ListDirectoryArgs())
+
+    assert paths(result) == ["f0.txt", "f1.txt", "f2.txt"]
+    assert result.was_truncated
+
+
+@pytest.mark.asyncio
+async def test_remembers_last_ten_listed_paths(list_dir, tree):
+    for _ in range(11):
+        await list_dir.run(ListDirectoryArgs(path="src"))
+    await list_dir.run(ListDirectoryArgs())
+
+    assert len(list_dir.state.recently_listed) == 10
+    assert list_dir.state.recently_listed[-1] == str(tree)
+
+
+@pytest.mark.asyncio
+async def test_raises_for_missing_path(list_dir):
+    with pytest.raises(ToolError, match="does not exist"):
+        await list_dir.run(ListDirectoryArgs(path="missing"))
+
+
+@pytest.mark.asyncio
+async def test_raises_for_file_path(list_dir, tree):
+    with pytest.raises(ToolError, match="not a directory"):
+        await list_dir.run(ListDirectoryArgs(path="b.txt"))
+
+
+@pytest.mark.asyncio
+async def test_applies_literal_and_wildcard_excludes(tmp_path, tree):
+    tool = ListDirectory(
+        config=ListDirectoryConfig(workdir=tmp_path, exclude_patterns=["docs", "*.md"]),
+        state=ListDirectoryState(),
+    )
+
+    result = await tool.run(ListDirectoryArgs())
+
+    assert paths(result) == ["node_modules", "src", "Alpha.txt", "b.txt"]
+
+
+@pytest.mark.asyncio
+async def test_stops_walking_once_past_max_entries(tmp_path, monkeypatch):
+    for i in range(10):
+        (tmp_path / f"d{i}").mkdir()
+        (tmp_path / f"d{i}" / "file.txt").write_text("")
+    tool = ListDirectory(
+        config=ListDirectoryConfig(workdir=tmp_path, max_entries=3),
+        state=ListDirectoryState(),
+    )
+    opened: list[str] = []
+    real_scandir = os.scandir
+
+    def tracking_scandir(path):
+        opened.append(os.path.relpath(path, tmp_path))
+        return real_scandir(path)
+
+    monkeypatch.setattr(os, "scandir", tracking_scandir)
+
+    result = await tool.run(ListDirectoryArgs(recursive=True))
+
+    assert paths(result) == ["d0", "d0/file.txt", "d1"]
+    assert result.was_truncated
+    # d2 and d3 may be listed ahead, but d4 onwards lie past the entry budget
+    assert {".", "d0", "d1"} <= set(opened) <= {".", "d0", "d1", "d2", "d3"}
+
+
+@pytest.mark.asyncio
+async def test_bounds_read_ahead_of_unreached_directories(tmp_path, monkeypatch):
+    for i in range(30):
+        (tmp_path / f"d{i:02}").mkdir()
+        for j in range(25):
+            (tmp_path / f"d{i:02}" / f"f{j:02}.txt").write_text("")
+    tool = ListDirectory(
+        config=ListDirectoryConfig(workdir=tmp_path, max_entries=20),
+        state=ListDirectoryState(),
+    )
+    opened: list[str] = []
+    real_scandir = os.scandir
+
+    def tracking_scandir(path):
+        opened.append(os.path.relpath(path, tmp_path))
+        return real_scandir(path)
+
+    monkeypatch.setattr(os, "scandir", tracking_scandir)
+
+    result = await tool.run(ListDirectoryArgs(recursive=True))
+
+    # The cap is reached inside d00, so only d00 is listed
+    assert {p.split("/")[0] for p in paths(result)} == {"d00"}
+    # At most SCAN_WORKERS subdirectories are opened ahead of the walk
+    read_ahead = {f"d{i:02}" for i in range(SCAN_WORKERS)}
+    assert {".", "d00"} <= set(opened) <= {".", *read_ahead}
@@ -1,18 +1,51 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-
-from vibe.core.custom_commands import CustomCommandLoader
-
-
-@dataclass
+import sys
+
+_HELP_HEADER: tuple[str, ...] = (
+    "### Keyboard Shortcuts",
+    "",
+    "- `Enter` Submit message",
+    "- `Ctrl+J` / `Shift+Enter` Insert newline",
+    "- `Escape` Interrupt agent or close dialogs",
+    "- `Ctrl+C` Quit (or clear input if text present)",
+    "- `Ctrl+O` Toggle tool output view",
+    "- `Ctrl+T` Toggle todo view",
+    "- `Shift+Tab` Toggle auto-approve mode",
+    "",
+    "### Special Features",
+    "",
+    "- `!<command>` Execute bash command directly",
+    "- `@path/to/file/` Autocompletes file paths",
+    "",
+    "### Built-in Commands",
+    "",
+)
+_CUSTOM_HELP_HEADER: tuple[str, ...] = ("", "### Custom Commands", "")
+
+
+@dataclass(slots=True, frozen=True)
 class Command:
     aliases: frozenset[str]
     description: str
     handler: str
     exits: bool = False
     is_custom: bool = False
+    sorted_aliases: tuple[str, ...] = field(init=False, repr=False)
+    aliases_md: str = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        sorted_aliases = tuple(sorted(self.aliases))
+        object.__setattr__(self, "sorted_aliases", sorted_aliases)
+        object.__setattr__(
+            self, "aliases_md", ", ".join(f"`{alias}`" for alias in sorted_aliases)
+        )
+
+
+def _format_command_line(cmd: Command) -> str:
+    return f"- {cmd.aliases_md}: {cmd.description}"
 
 
 class CommandRegistry:
@@ -21,7 +54,7 @@ class CommandRegistry:
     ) -> None:
         if excluded_commands is None:
             excluded_commands = []
-        self.commands = {
+        self._builtin: dict[str, Command] = {
             "help": Command(
                 aliases=frozenset(["/help"]),
                 description="Show help message",
@@ -71,25 +104,35 @@ class CommandRegistry:
         }
 
         for command in excluded_commands:
-            self.commands.pop(command, None)
+            self._builtin.pop(command, None)
 
         # Load custom commands
+        self._custom: dict[str, Command] = {}
         self._load_custom_commands(commands_dir)
 
-        self._alias_map = {}
-        for cmd_name, cmd in self.commands.items():
-            for alias in cmd.aliases:
-                self._alias_map[alias] = cmd_name
+        self.commands = {**self._builtin, **self._custom}
+
+        self._alias_map: dict[str, Command] = {
+            sys.intern(alias.strip().lower()): cmd
+            for cmd in self.commands.values()
+            for alias in cmd.aliases
+        }
+        self._max_alias_len = max(map(len, self._alias_map), default=0)
+
+        self._help_text = self._build_help_text()
 
     def _load_custom_commands(self, commands_dir: Path | None) -> None:
         """Load custom commands from the commands directory."""
         try:
+            from vibe.core.custom_commands import CustomCommandLoader
+
             loader = CustomCommandLoader(commands_dir)
             custom_commands = loader.load_commands()
 
             for cmd_name, cmd_def in custom_commands.items():
                 # Create a Command object from CustomCommandDefinition
-                self.commands[cmd_name] = Command(
+                self._builtin.pop(cmd_name, None)
+                self._custom[cmd_name] = Command(
                     aliases=frozenset(cmd_def.aliases),
                     description=cmd_def.description,
                     handler=f"_custom_{cmd_name}",  # Custom handler name
@@ -101,44 +144,23 @@ class CommandRegistry:
             print(f"Warning: Failed to load custom commands: {e}")
 
     def find_command(self, user_input: str) -> Command | None:
-        cmd_name = self._alias_map.get(user_input.lower().strip())
-        return self.commands.get(cmd_name) if cmd_name else None
+        # Most input is plain chat text: reject it before allocating anything.
+        if not user_input.lstrip().startswith("/"):
+            return None
+        candidate = user_input.strip()
+        if len(candidate) > self._max_alias_len:
+            return None
+        return self._alias_map.get(candidate.lower())
 
     def get_help_text(self) -> str:
-        lines: list[str] = [
-            "### Keyboard Shortcuts",
-            "",
-            "- `Enter` Submit message",
-            "- `Ctrl+J` / `Shift+Enter` Insert newline",
-            "- `Escape` Interrupt agent or close dialogs",
-            "- `Ctrl+C` Quit (or clear input if text present)",
-            "- `Ctrl+O` Toggle tool output view",
-            "- `Ctrl+T` Toggle todo view",
-            "- `Shift+Tab` Toggle auto-approve mode",
-            "",
-            "### Special Features",
-            "",
-            "- `!<command>` Execute bash command directly",
-            "- `@path/to/file/` Autocompletes file paths",
-            "",
-            "### Built-in Commands",
-            "",
-        ]
-
-        # Separate built-in and custom commands
-        builtin_commands = [cmd for cmd in self.commands.values() if not cmd.is_custom]
-        custom_commands = [cmd for cmd in self.commands.values() if cmd.is_custom]
-
-        for cmd in builtin_commands:
-            aliases = ", ".join(f"`{alias}`" for alias in sorted(cmd.aliases))
-            lines.append(f"- {aliases}: {cmd.description}")
-
-        if custom_commands:
-            lines.append("")
-            lines.append("### Custom Commands")
-            lines.append("")
-            for cmd in custom_commands:
-                aliases = ", ".join(f"`{alias}`" for alias in sorted(cmd.aliases))
-                lines.append(f"- {aliases}: {cmd.description}")
+        return self._help_text
+
+    def _build_help_text(self) -> str:
+        lines = list(_HELP_HEADER)
+        lines.extend(_format_command_line(cmd) for cmd in self._builtin.values())
+
+        if self._custom:
+            lines.extend(_CUSTOM_HELP_HEADER)
+            lines.extend(_format_command_line(cmd) for cmd in self._custom.values())
 
         return "\n".join(lines)
@@ -605,8 +605,10 @@ class VibeApp(App[None]):
             return
 
         with suppress(Exception):
-            panel = self.query_one(panel_id)
-            panel.toggle_class("hidden")
+            from vibe.cli.textual_ui.widgets.panels import BasePanel
+
+            panel = self.query_one(panel_id, BasePanel)
+            panel.toggle_visibility()
 
     @on(ScreenResume)
     def handle_screen_resume(self, event: ScreenResume) -> None:
@@ -15,72 +15,7 @@ class LayoutSelectionScreen(ModalScreen[tuple[bool, bool]]):
         Tuple of (use_grid_layout: bool, remember_choice: bool)
     """
 
-    CSS = """
-    LayoutSelectionScreen {
-        align: center middle;
-    }
-    
-    #layout-selection-container {
-        width: 70;
-        height: auto;
-        background: $surface;
-        border: thick $primary;
-        padding: 2;
-    }
-    
-    #layout-title {
-        width: 100%;
-        text-align: center;
-        color: $primary;
-        text-style: bold;
-        margin-bottom: 1;
-    }
-    
-    #layout-subtitle {
-        width: 100%;
-        text-align: center;
-        color: $text;
-        margin-bottom: 2;
-    }
-    
-    .layout-option {
-        width: 100%;
-        height: auto;
-        border: round $accent;
-        padding: 1 2;
-        margin-bottom: 1;
-        background: $background;
-    }
-    
-    .layout-option:hover {
-        border: round $primary;
-        background: $boost;
-    }
-    
-    .layout-option-title {
-        color: $primary;
-        text-style: bold;
-    }
-    
-    .layout-option-desc {
-        color: $text-muted;
-    }
-    
-    #remember-checkbox-container {
-        width: 100%;
-        margin-top: 1;
-        margin-bottom: 2;
-    }
-    
-    #button-container {
-        width: 100%;
-        height: auto;
-    }
-    
-    .layout-button {
-        margin: 0 1;
-    }
-    """
+    CSS_PATH = "layout_selection.tcss"
 
     def __init__(self) -> None:
         super().__init__()
@@ -49,7 +49,7 @@ class ChatInputContainer(Vertical):
         command_entries = [
             (alias, command.description)
             for command in self._command_registry.commands.values()
-            for alias in sorted(command.aliases)
+            for alias in command.sorted_aliases
         ]
 
         self._completion_manager = MultiCompletionManager([
@@ -2,15 +2,20 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
+
 from textual.app import ComposeResult
 from textual.containers import Vertical
 from textual.reactive import reactive
+from textual.timer import Timer
 from textual.widgets import Static
 
 
 class BasePanel(Vertical):
     """Base class for all Bento Grid panels."""
 
+    UPDATE_INTERVAL = 0.1  # Coalesce display updates to at most ~10 per second
+
     visible: reactive[bool] = reactive(True)
 
     def __init__(
@@ -21,6 +26,8 @@ class BasePanel(Vertical):
         super().__init__(**kwargs)
         self._title = title
         self._title_widget: Static | None = None
+        self._pending_update: Callable[[], None] | None = None
+        self._update_timer: Timer | None = None
 
     def compose(self) -> ComposeResult:
         """Compose the panel with title."""
@@ -34,6 +41,33 @@ class BasePanel(Vertical):
         if self._title_widget:
             self._title_widget.update(f"[bold]{title}[/bold]")
 
+    def schedule_update(self, callback: Callable[[], None]) -> None:
+        """Run a display update, coalescing bursts into a single render.
+
+        Only the most recently scheduled callback runs once the interval
+        elapses, so rapid successive updates cost one redraw.
+        """
+        if not self.is_mounted:
+            callback()
+            return
+
+        self._pending_update = callback
+        if self._update_timer is None:
+            self._update_timer = self.set_timer(
+                self.UPDATE_INTERVAL, self._flush_update
+            )
+
+    def cancel_update(self) -> None:
+        """Drop any display update that has not run yet."""
+        self._pending_update = None
+
+    def _flush_update(self) -> None:
+        """Run the pending display update, if any."""
+        self._update_timer = None
+        callback, self._pending_update = self._pending_update, None
+        if callback:
+            callback()
+
     def watch_visible(self, visible: bool) -> None:
         """React to visibility changes."""
         self.display = visible
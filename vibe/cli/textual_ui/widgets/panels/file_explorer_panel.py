@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from collections import deque
+from collections import OrderedDict
+import os
 from pathlib import Path
 
 from textual.app import ComposeResult
@@ -18,7 +19,8 @@ class FileExplorerPanel(BasePanel):
 
     def __init__(self, **kwargs) -> None:
         super().__init__(title="File Explorer", **kwargs)
-        self._recent_files: deque[str] = deque(maxlen=self.MAX_RECENT_FILES)
+        # Full path -> display name, oldest first; the most recent file is last
+        self._recent_files: OrderedDict[str, str] = OrderedDict()
         self._files_display: Static | None = None
 
     def compose(self) -> ComposeResult:
@@ -33,11 +35,11 @@ class FileExplorerPanel(BasePanel):
         """Track a recently accessed file."""
         path_str = str(file_path)
 
-        # Remove if already exists (to move to front)
-        if path_str in self._recent_files:
-            self._recent_files.remove(path_str)
-
-        self._recent_files.appendleft(path_str)
+        # Re-insert so an already tracked file moves to the most recent slot
+        self._recent_files.pop(path_str, None)
+        self._recent_files[path_str] = os.path.basename(path_str)
+        if len(self._recent_files) > self.MAX_RECENT_FILES:
+            self._recent_files.popitem(last=False)
         self._update_display()
 
     def _format_files(self) -> str:
@@ -45,16 +47,17 @@ class FileExplorerPanel(BasePanel):
         if not self._recent_files:
             return "[dim]No recent files[/dim]"
 
-        lines = []
-        for i, file_path in enumerate(self._recent_files, 1):
-            # Show just the filename, with relative path on hover
-            path = Path(file_path)
-            filename = path.name
-            lines.append(f"{i:2d}. {filename}")
-
-        return "\n".join(lines)
+        # Show just the filename, most recent first
+        return "\n".join(
+            f"{i:2d}. {filename}"
+            for i, filename in enumerate(reversed(self._recent_files.values()), 1)
+        )
 
     def _update_display(self) -> None:
+        """Schedule an update of the files display."""
+        self.schedule_update(self._do_update_display)
+
+    def _do_update_display(self) -> None:
         """Update the files display."""
         if self._files_display:
             self._files_display.update(self._format_files())
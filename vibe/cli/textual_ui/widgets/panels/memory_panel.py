@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import partial
 from typing import TYPE_CHECKING
 
 from textual.app import ComposeResult
@@ -21,6 +22,7 @@ class MemoryPanel(BasePanel):
         self._max_context = max_context
         self._progress_bar: ProgressBar | None = None
         self._stats_display: Static | None = None
+        self._last_percentage: int | None = None
 
     def compose(self) -> ComposeResult:
         """Compose memory panel with progress bar and stats."""
@@ -40,26 +42,26 @@ class MemoryPanel(BasePanel):
         if max_context:
             self._max_context = max_context
 
+        self.schedule_update(partial(self._render_stats, message_count, stats))
+
+    def _render_stats(self, message_count: int, stats: AgentStats | None) -> None:
+        """Push the latest stats into the progress bar and summary."""
         # Update progress bar
-        if self._progress_bar and stats and hasattr(stats, 'context_tokens'):
-            context_tokens = stats.context_tokens
-            percentage = min(100, (context_tokens / self._max_context) * 100) if self._max_context > 0 else 0
-            self._progress_bar.update(progress=percentage)
+        if self._progress_bar and stats:
+            percentage = min(100, stats.context_tokens * 100 // self._max_context) if self._max_context > 0 else 0
+            if percentage != self._last_percentage:
+                self._last_percentage = percentage
+                self._progress_bar.update(progress=percentage)
 
         # Update stats
         if self._stats_display:
-            lines = []
-
-            lines.append(f"Messages: {message_count}")
-
+            text = f"Messages: {message_count}"
             if stats:
-                if hasattr(stats, 'context_tokens'):
-                    lines.append(f"Tokens: {stats.context_tokens:,}/{self._max_context:,}")
-
-                if hasattr(stats, 'turns'):
-                    lines.append(f"Turns: {stats.turns}")
-
-            self._stats_display.update("\n".join(lines))
+                text += (
+                    f"\nTokens: {stats.context_tokens:,}/{self._max_context:,}"
+                    f"\nTurns: {stats.steps}"
+                )
+            self._stats_display.update(text)
 
     def set_max_context(self, max_context: int) -> None:
         """Update maximum context size."""
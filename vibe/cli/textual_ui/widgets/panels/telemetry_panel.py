@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import partial
 from typing import TYPE_CHECKING
 
 from textual.app import ComposeResult
@@ -23,6 +24,7 @@ class TelemetryPanel(BasePanel):
         self._duration_sparkline: Sparkline | None = None
         self._cost_sparkline: Sparkline | None = None
         self._stats_display: Static | None = None
+        self._latest_stats: AgentStats | None = None
 
     def compose(self) -> ComposeResult:
         """Compose telemetry panel with sparklines and stats."""
@@ -52,33 +54,46 @@ class TelemetryPanel(BasePanel):
         if not stats:
             return
 
-        # Update sparklines
-        if self._token_sparkline and hasattr(stats, 'last_turn_total_tokens'):
-            self._token_sparkline.add_point(float(stats.last_turn_total_tokens))
-
-        if self._duration_sparkline and hasattr(stats, 'last_turn_duration'):
-            self._duration_sparkline.add_point(stats.last_turn_duration)
+        # Keep recording history while hidden, but skip all redraws
+        visible = self.visible
+        if self._token_sparkline:
+            self._token_sparkline.add_point(float(stats.last_turn_total_tokens), refresh=visible)
 
-        if self._cost_sparkline and hasattr(stats, 'last_turn_cost'):
-            self._cost_sparkline.add_point(stats.last_turn_cost * 1000)  # Convert to millicents for better visualization
+        if self._duration_sparkline:
+            self._duration_sparkline.add_point(stats.last_turn_duration, refresh=visible)
 
-        # Update summary stats
-        if self._stats_display:
-            summary_lines = []
+        if self._cost_sparkline:
+            self._cost_sparkline.add_point(stats.last_turn_cost * 1000, refresh=visible)  # Convert to millicents for better visualization
 
-            if hasattr(stats, 'total_tokens'):
-                summary_lines.append(f"Total: {stats.total_tokens:,} tokens")
+        self._latest_stats = stats
+        if visible:
+            self.schedule_update(partial(self._update_summary, stats))
 
-            if hasattr(stats, 'total_cost'):
-                summary_lines.append(f"Cost: ${stats.total_cost:.4f}")
+    def watch_visible(self, visible: bool) -> None:
+        """Catch up on updates skipped while the panel was hidden."""
+        super().watch_visible(visible)
+        if not visible:
+            return
 
-            if hasattr(stats, 'turns'):
-                summary_lines.append(f"Turns: {stats.turns}")
+        for sparkline in (self._token_sparkline, self._duration_sparkline, self._cost_sparkline):
+            if sparkline:
+                sparkline.refresh()
+        if self._latest_stats:
+            self.schedule_update(partial(self._update_summary, self._latest_stats))
 
-            self._stats_display.update("\n".join(summary_lines))
+    def _update_summary(self, stats: AgentStats) -> None:
+        """Update the summary statistics text."""
+        if self._stats_display:
+            self._stats_display.update(
+                f"Total: {stats.session_total_llm_tokens:,} tokens\n"
+                f"Cost: ${stats.session_cost:.4f}\n"
+                f"Turns: {stats.steps}"
+            )
 
     def clear_metrics(self) -> None:
         """Clear all metrics and sparklines."""
+        self.cancel_update()
+        self._latest_stats = None
         if self._token_sparkline:
             self._token_sparkline.clear()
         if self._duration_sparkline:
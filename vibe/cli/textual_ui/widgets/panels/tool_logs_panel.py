@@ -17,6 +17,7 @@ class ToolLogsPanel(BasePanel):
     def __init__(self, **kwargs) -> None:
         super().__init__(title="Tool Logs", **kwargs)
         self._scroll_container: VerticalScroll | None = None
+        self._scroll_pending = False
 
     def compose(self) -> ComposeResult:
         """Compose tool logs panel with scrollable container."""
@@ -32,15 +33,37 @@ class ToolLogsPanel(BasePanel):
 
         await self._scroll_container.mount(tool_widget)
 
-        # Cleanup old logs if exceeding limit
-        children = list(self._scroll_container.children)
+        # Logs only ever grow by one here, so at most the oldest one is dropped
+        children = self._scroll_container.children
         if len(children) > self.MAX_TOOL_LOGS:
-            oldest = children[:-self.MAX_TOOL_LOGS]
-            for widget in oldest:
-                await widget.remove()
+            await children[0].remove()
 
-        # Auto-scroll to bottom
-        self.call_later(lambda: self._scroll_container.scroll_end(animate=False))
+        self._schedule_scroll_end()
+
+    async def add_tool_logs(self, tool_widgets: list[Widget]) -> None:
+        """Add several tool execution logs with a single mount."""
+        if not self._scroll_container or not tool_widgets:
+            return
+
+        await self._scroll_container.mount_all(tool_widgets)
+
+        children = self._scroll_container.children
+        excess = len(children) - self.MAX_TOOL_LOGS
+        if excess > 0:
+            await self._scroll_container.remove_children(children[:excess])
+
+        self._schedule_scroll_end()
+
+    def _schedule_scroll_end(self) -> None:
+        """Auto-scroll to bottom once, however many logs arrive before it runs."""
+        if not self._scroll_pending:
+            self._scroll_pending = True
+            self.call_later(self._scroll_end)
+
+    def _scroll_end(self) -> None:
+        self._scroll_pending = False
+        if self._scroll_container:
+            self._scroll_container.scroll_end(animate=False)
 
     async def clear_logs(self) -> None:
         """Clear all tool logs."""
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections import deque
+
 from textual.reactive import reactive
 from textual.widget import Widget
 
@@ -12,7 +14,6 @@ class Sparkline(Widget):
     # Unicode block characters from low to high
     BLOCKS = ["▁", "▂", "▃", "▄", "▅", "▆", "▇", "█"]
 
-    data_points: reactive[list[float]] = reactive(list, init=False)
     max_points: reactive[int] = reactive(20)
     min_value: reactive[float | None] = reactive(None)
     max_value: reactive[float | None] = reactive(None)
@@ -24,52 +25,75 @@ class Sparkline(Widget):
         **kwargs,
     ) -> None:
         super().__init__(**kwargs)
-        self.data_points = initial_data or []
+        # Bounded ring buffer: appending past max_points drops the oldest point
+        self._buffer: deque[float] = deque(initial_data or (), maxlen=max_points)
         self.max_points = max_points
 
-    def add_point(self, value: float) -> None:
-        """Add a data point to the sparkline."""
-        self.data_points = [*self.data_points, value]
-        if len(self.data_points) > self.max_points:
-            self.data_points = self.data_points[-self.max_points:]
-        self.refresh()
+    @property
+    def data_points(self) -> list[float]:
+        """Current data points, oldest first."""
+        return list(self._buffer)
+
+    def watch_max_points(self, max_points: int) -> None:
+        """Resize the buffer, keeping the most recent points."""
+        if self._buffer.maxlen != max_points:
+            self._buffer = deque(self._buffer, maxlen=max_points)
+
+    def add_point(self, value: float, refresh: bool = True) -> None:
+        """Add a data point to the sparkline.
+
+        Pass ``refresh=False`` to record the point without redrawing, e.g.
+        while the sparkline is hidden.
+        """
+        self._buffer.append(value)
+        if refresh:
+            self.refresh()
 
     def set_data(self, data: list[float]) -> None:
         """Set all data points at once."""
-        self.data_points = data[-self.max_points:] if len(data) > self.max_points else list(data)
+        self._buffer.clear()
+        self._buffer.extend(data)
         self.refresh()
 
     def clear(self) -> None:
         """Clear all data points."""
-        self.data_points = []
+        self._buffer.clear()
         self.refresh()
 
-    def _normalize_value(self, value: float, min_val: float, max_val: float) -> int:
-        """Normalize a value to a block index (0-7)."""
-        if max_val == min_val:
-            return len(self.BLOCKS) // 2
-
-        normalized = (value - min_val) / (max_val - min_val)
-        index = int(normalized * (len(self.BLOCKS) - 1))
-        return max(0, min(len(self.BLOCKS) - 1, index))
+    def _bounds(self) -> tuple[float, float]:
+        """Return the (min, max) used for scaling, in a single pass over the data."""
+        lo = hi = self._buffer[0]
+        for value in self._buffer:
+            if value < lo:
+                lo = value
+            elif value > hi:
+                hi = value
+
+        if self.min_value is not None:
+            lo = self.min_value
+        if self.max_value is not None:
+            hi = self.max_value
+        return lo, hi
 
     def render(self) -> str:
         """Render the sparkline as a string of block characters."""
-        if not self.data_points:
+        if not self._buffer:
             return "─" * self.max_points
 
-        # Determine min/max values
-        min_val = self.min_value if self.min_value is not None else min(self.data_points)
-        max_val = self.max_value if self.max_value is not None else max(self.data_points)
-
-        # Generate sparkline
-        blocks = []
-        for value in self.data_points:
-            block_index = self._normalize_value(value, min_val, max_val)
-            blocks.append(self.BLOCKS[block_index])
+        blocks = self.BLOCKS
+        top = len(blocks) - 1
+        min_val, max_val = self._bounds()
 
-        # Pad with spaces if needed
-        while len(blocks) < self.max_points:
-            blocks.insert(0, " ")
-
-        return "".join(blocks)
+        if max_val == min_val:
+            line = blocks[len(blocks) // 2] * len(self._buffer)
+        else:
+            # Divide by the span first: the maximum then gives exactly 1.0 and
+            # lands on the top block, which a precomputed top / span may miss
+            span = max_val - min_val
+            line = "".join(
+                blocks[max(0, min(top, int((value - min_val) / span * top)))]
+                for value in self._buffer
+            )
+
+        # Left-pad so the newest point stays at the right edge
+        return " " * (self.max_points - len(line)) + line
@@ -6,16 +6,34 @@ loaded from configuration files and executed within the Vibe CLI.
 
 from __future__ import annotations
 
+import asyncio
+from dataclasses import dataclass, field, fields
+from enum import StrEnum, auto
+import json
 import os
-import subprocess
-import tomllib
-from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Callable
+import re
+from typing import Any, Callable, ClassVar
 
 from vibe.core.paths.config_paths import VIBE_HOME
 
 
+class HandlerKind(StrEnum):
+    """Kind of handler a custom command runs, named as in its TOML "type"."""
+
+    BASH = auto()
+    PROMPT = auto()
+    PYTHON = auto()
+
+
+# TOML key holding the handler for each kind; "handler" is accepted for all
+_HANDLER_KEYS = {
+    HandlerKind.BASH: "command",
+    HandlerKind.PROMPT: "template",
+    HandlerKind.PYTHON: "function",
+}
+
+
 @dataclass
 class CustomCommandDefinition:
     """Definition of a custom slash command."""
@@ -26,11 +44,43 @@ class CustomCommandDefinition:
     command_type: str  # "bash", "prompt", "python"
     handler: str | dict[str, Any]
     exits: bool = False
+    kind: HandlerKind | None = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.kind = (
+            HandlerKind(self.command_type) if self.command_type in HandlerKind else None
+        )
+
+
+_CachedDefinition = tuple[tuple[int, int], CustomCommandDefinition | None]
+
+# JSON parse cache kept alongside the command files; bump the version
+# whenever CustomCommandDefinition changes shape
+CACHE_FILE_NAME = ".cache.json"
+_CACHE_VERSION = 2
+
+# Lines that can define the top-level "command" key, bare or quoted: a
+# [command] table header, a dotted "command.x = ..." key or a
+# "command = {...}" inline table
+_COMMAND_KEY_RE = re.compile(
+    rb"^[ \t]*\[{0,2}[ \t]*[\"']?command[\"']?[ \t]*[\].=]", re.MULTILINE
+)
+
+
+def _definition_fields(definition: CustomCommandDefinition) -> dict[str, Any]:
+    """Return the constructor arguments that rebuild a definition."""
+    return {f.name: getattr(definition, f.name) for f in fields(definition) if f.init}
 
 
 class CustomCommandLoader:
     """Loads custom commands from configuration files."""
 
+    # Parsed definitions keyed by file path, tagged with the (mtime_ns, size)
+    # they were parsed from so unchanged files are not re-parsed.
+    _parse_cache: ClassVar[dict[str, _CachedDefinition]] = {}
+    # Last contents of each directory's on-disk cache, keyed by directory
+    _disk_caches: ClassVar[dict[str, dict[str, _CachedDefinition]]] = {}
+
     def __init__(self, commands_dir: Path | None = None) -> None:
         """Initialize the custom command loader.
 
@@ -48,21 +98,95 @@ class CustomCommandLoader:
         """
         commands: dict[str, CustomCommandDefinition] = {}
 
-        if not self.commands_dir.exists():
+        try:
+            entries = os.scandir(self.commands_dir)
+        except OSError:
             return commands
 
+        cache_key = str(self.commands_dir)
+        disk_cache = self._disk_caches.get(cache_key)
+        if disk_cache is None:
+            disk_cache = self._read_disk_cache()
+            self._parse_cache.update(disk_cache)
+
         # Load all .toml files in the commands directory
-        for command_file in self.commands_dir.glob("*.toml"):
-            try:
-                loaded = self._load_command_file(command_file)
-                if loaded:
-                    commands[loaded.name] = loaded
-            except Exception as e:
-                # Log error but continue loading other commands
-                print(f"Warning: Failed to load command from {command_file}: {e}")
+        current: dict[str, _CachedDefinition] = {}
+        with entries:
+            for entry in entries:
+                if not entry.name.endswith(".toml"):
+                    continue
+                try:
+                    if not entry.is_file():
+                        continue
+                    loaded = self._load_cached(entry)
+                    current[entry.path] = self._parse_cache[entry.path]
+                    if loaded:
+                        commands[loaded.name] = loaded
+                except Exception as e:
+                    # Log error but continue loading other commands
+                    print(f"Warning: Failed to load command from {entry.path}: {e}")
+
+        if current != disk_cache:
+            self._write_disk_cache(current)
+        self._disk_caches[cache_key] = current
 
         return commands
 
+    def _read_disk_cache(self) -> dict[str, _CachedDefinition]:
+        """Read the JSON parse cache, treating any failure as an empty cache."""
+        try:
+            with open(self.commands_dir / CACHE_FILE_NAME, "rb") as f:
+                data = json.load(f)
+            if data["version"] != _CACHE_VERSION:
+                return {}
+            # Definitions are rebuilt through the constructor, so a malformed
+            # entry fails here instead of surfacing later
+            return {
+                path: (
+                    (int(mtime_ns), int(size)),
+                    None if kwargs is None else CustomCommandDefinition(**kwargs),
+                )
+                for path, ((mtime_ns, size), kwargs) in data["entries"].items()
+            }
+        except Exception:
+            return {}
+
+    def _write_disk_cache(self, cache: dict[str, _CachedDefinition]) -> None:
+        """Atomically replace the JSON parse cache, ignoring write failures."""
+        entries = {
+            path: (stat_key, None if loaded is None else _definition_fields(loaded))
+            for path, (stat_key, loaded) in cache.items()
+        }
+        cache_file = self.commands_dir / CACHE_FILE_NAME
+        tmp_file = cache_file.with_name(f"{CACHE_FILE_NAME}.{os.getpid()}.tmp")
+        try:
+            tmp_file.write_text(
+                json.dumps({"version": _CACHE_VERSION, "entries": entries})
+            )
+            os.replace(tmp_file, cache_file)
+        except OSError:
+            tmp_file.unlink(missing_ok=True)
+
+    def _load_cached(self, entry: os.DirEntry[str]) -> CustomCommandDefinition | None:
+        """Load a command file, reusing the last parse if the file is unchanged.
+
+        Args:
+            entry: Directory entry of the command definition file.
+
+        Returns:
+            CustomCommandDefinition if the file defines a command, None otherwise.
+        """
+        st = entry.stat()
+        stat_key = (st.st_mtime_ns, st.st_size)
+        cached = self._parse_cache.get(entry.path)
+        if cached is not None and cached[0] == stat_key:
+            return cached[1]
+
+        # An empty file cannot contain a [command] section
+        loaded = None if st.st_size == 0 else self._load_command_file(Path(entry.path))
+        self._parse_cache[entry.path] = (stat_key, loaded)
+        return loaded
+
     def _load_command_file(self, file_path: Path) -> CustomCommandDefinition | None:
         """Load a single command definition from a TOML file.
 
@@ -73,7 +197,15 @@ class CustomCommandLoader:
             CustomCommandDefinition if successful, None otherwise.
         """
         with open(file_path, "rb") as f:
-            data = tomllib.load(f)
+            raw = f.read()
+
+        # Skip the TOML parser for files that cannot contain a command
+        if not _COMMAND_KEY_RE.search(raw):
+            return None
+
+        import tomllib
+
+        data = tomllib.loads(raw.decode())
 
         if "command" not in data:
             return None
@@ -82,9 +214,9 @@ class CustomCommandLoader:
 
         # Validate required fields
         required = ["name", "description", "type"]
-        for field in required:
-            if field not in cmd_data:
-                raise ValueError(f"Missing required field '{field}' in {file_path}")
+        for key in required:
+            if key not in cmd_data:
+                raise ValueError(f"Missing required field '{key}' in {file_path}")
 
         # Get aliases (defaults to /name if not specified)
         aliases = cmd_data.get("aliases", [f"/{cmd_data['name']}"])
@@ -96,14 +228,10 @@ class CustomCommandLoader:
 
         # Get handler based on type
         command_type = cmd_data["type"]
-        if command_type == "bash":
-            handler = cmd_data.get("command", cmd_data.get("handler", ""))
-        elif command_type == "prompt":
-            handler = cmd_data.get("template", cmd_data.get("handler", ""))
-        elif command_type == "python":
-            handler = cmd_data.get("function", cmd_data.get("handler", ""))
-        else:
+        if command_type not in HandlerKind:
             raise ValueError(f"Unknown command type '{command_type}' in {file_path}")
+        handler_key = _HANDLER_KEYS[HandlerKind(command_type)]
+        handler = cmd_data.get(handler_key, cmd_data.get("handler", ""))
 
         return CustomCommandDefinition(
             name=cmd_data["name"],
@@ -181,21 +309,29 @@ class CustomCommandExecutor:
         Returns:
             Tuple of (stdout, stderr, returncode).
         """
+        proc = None
         try:
-            result = subprocess.run(
+            proc = await asyncio.create_subprocess_shell(
                 command,
-                shell=True,
-                capture_output=True,
-                text=True,
-                timeout=timeout,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
                 cwd=self.workdir,
                 executable="/bin/bash" if os.name != "nt" else None,
             )
-            return result.stdout, result.stderr, result.returncode
-        except subprocess.TimeoutExpired:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+            return (
+                stdout.decode("utf-8", errors="replace"),
+                stderr.decode("utf-8", errors="replace"),
+                proc.returncode or 0,
+            )
+        except TimeoutError:
             return "", f"Command timed out after {timeout}s", 124
         except Exception as e:
             return "", f"Error executing command: {e}", 1
+        finally:
+            if proc is not None and proc.returncode is None:
+                proc.kill()
+                await proc.wait()
 
     def get_prompt_text(self, template: str) -> str:
         """Get the prompt text for a prompt-type command.
@@ -221,27 +357,36 @@ def create_custom_command_handler(
     Returns:
         Async handler function.
     """
+    # Dispatch on the command kind once, not on every invocation
+    if definition.kind is HandlerKind.BASH:
+        command: str = definition.handler  # type: ignore
 
-    async def handler() -> dict[str, Any]:
-        """Execute the custom command and return results."""
-        if definition.command_type == "bash":
-            stdout, stderr, returncode = await executor.execute_bash_command(
-                definition.handler  # type: ignore
-            )
+        async def run_bash() -> dict[str, Any]:
+            """Run the bash command and return its output."""
+            stdout, stderr, returncode = await executor.execute_bash_command(command)
             return {
                 "type": "bash",
                 "stdout": stdout,
                 "stderr": stderr,
                 "returncode": returncode,
-                "command": definition.handler,
+                "command": command,
             }
-        elif definition.command_type == "prompt":
-            prompt_text = executor.get_prompt_text(definition.handler)  # type: ignore
+
+        return run_bash
+
+    if definition.kind is HandlerKind.PROMPT:
+        prompt_text = executor.get_prompt_text(definition.handler)  # type: ignore
+
+        async def return_prompt() -> dict[str, Any]:
+            """Return the prepared prompt text."""
             return {"type": "prompt", "text": prompt_text}
-        else:
-            return {
-                "type": "error",
-                "message": f"Unknown command type: {definition.command_type}",
-            }
 
-    return handler
+        return return_prompt
+
+    message = f"Unknown command type: {definition.command_type}"
+
+    async def report_error() -> dict[str, Any]:
+        """Report that the command type cannot be run."""
+        return {"type": "error", "message": message}
+
+    return report_error
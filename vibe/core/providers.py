@@ -6,14 +6,16 @@ like Ollama, llama.cpp, vLLM, LocalAI, and others.
 
 from __future__ import annotations
 
+from collections.abc import Iterator, Mapping, Sequence
 from dataclasses import dataclass
+from types import MappingProxyType
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from vibe.core.config import Backend, ModelConfig, ProviderConfig
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ProviderPreset:
     """A preset configuration for a provider."""
 
@@ -28,8 +30,8 @@ class ProviderPreset:
     notes: str = ""
 
 
-# Built-in provider presets for common local LLM backends
-PROVIDER_PRESETS: dict[str, ProviderPreset] = {
+# Built-in provider presets for common local LLM backends, keyed by lowercase name
+PROVIDER_PRESETS: Mapping[str, ProviderPreset] = MappingProxyType({
     "ollama": ProviderPreset(
         name="ollama",
         description="Ollama - Run LLMs locally with ease",
@@ -140,60 +142,72 @@ PROVIDER_PRESETS: dict[str, ProviderPreset] = {
         supports_tools=True,
         notes="Requires MISTRAL_API_KEY environment variable",
     ),
-}
+})
+
+_ALL_PRESETS: tuple[ProviderPreset, ...] = tuple(PROVIDER_PRESETS.values())
+
+# Presets under the casings users commonly type, so lookups rarely need lower()
+_PRESET_LOOKUP: Mapping[str, ProviderPreset] = MappingProxyType({
+    variant: preset
+    for name, preset in PROVIDER_PRESETS.items()
+    for variant in (name, name.upper(), name.capitalize())
+})
+
+_LOCAL_API_PREFIXES = ("http://localhost", "http://127.0.0.1")
 
 
 def get_provider_preset(name: str) -> ProviderPreset | None:
     """Get a provider preset by name (case-insensitive)."""
-    return PROVIDER_PRESETS.get(name.lower())
+    return _PRESET_LOOKUP.get(name) or PROVIDER_PRESETS.get(name.lower())
 
 
-def list_provider_presets() -> list[ProviderPreset]:
+def list_provider_presets() -> tuple[ProviderPreset, ...]:
     """Get all available provider presets."""
-    return list(PROVIDER_PRESETS.values())
+    return _ALL_PRESETS
 
 
 def format_provider_list(
-    presets: list[ProviderPreset], configured_providers: list[str] | None = None
+    presets: Sequence[ProviderPreset], configured_providers: list[str] | None = None
 ) -> str:
     """Format provider presets for display."""
-    lines = []
-    lines.append("Available Provider Presets:")
-    lines.append("=" * 50)
+    return "\n".join(_format_lines(presets, set(configured_providers or ())))
 
-    # Group by local vs remote
-    local_presets = [
-        p for p in presets if p.api_base.startswith("http://localhost")
-        or p.api_base.startswith("http://127.0.0.1")
-    ]
-    remote_presets = [p for p in presets if p not in local_presets]
 
-    lines.append("\n[Local Providers]")
+def _format_lines(
+    presets: Sequence[ProviderPreset], configured: set[str]
+) -> Iterator[str]:
+    # Group by local vs remote
+    local_presets: list[ProviderPreset] = []
+    remote_presets: list[ProviderPreset] = []
+    for preset in presets:
+        if preset.api_base.startswith(_LOCAL_API_PREFIXES):
+            local_presets.append(preset)
+        else:
+            remote_presets.append(preset)
+
+    yield "Available Provider Presets:"
+    yield "=" * 50
+
+    yield "\n[Local Providers]"
     for preset in local_presets:
-        configured = (
-            " (configured)" if configured_providers and preset.name in configured_providers else ""
-        )
-        lines.append(f"  {preset.name:<12} - {preset.description}{configured}")
-        lines.append(f"               API: {preset.api_base}")
+        marker = " (configured)" if preset.name in configured else ""
+        yield f"  {preset.name:<12} - {preset.description}{marker}"
+        yield f"               API: {preset.api_base}"
         if preset.notes:
-            lines.append(f"               Note: {preset.notes}")
+            yield f"               Note: {preset.notes}"
 
-    lines.append("\n[Remote Providers]")
+    yield "\n[Remote Providers]"
     for preset in remote_presets:
-        configured = (
-            " (configured)" if configured_providers and preset.name in configured_providers else ""
-        )
-        lines.append(f"  {preset.name:<12} - {preset.description}{configured}")
-        lines.append(f"               API: {preset.api_base}")
+        marker = " (configured)" if preset.name in configured else ""
+        yield f"  {preset.name:<12} - {preset.description}{marker}"
+        yield f"               API: {preset.api_base}"
         if preset.api_key_env_var:
-            lines.append(f"               Key: ${preset.api_key_env_var}")
-
-    lines.append("\nUsage Examples:")
-    lines.append("  vibe --provider ollama --model devstral")
-    lines.append("  vibe --provider vllm --api-base http://localhost:8000/v1")
-    lines.append("  vibe --provider openai --model gpt-4o")
+            yield f"               Key: ${preset.api_key_env_var}"
 
-    return "\n".join(lines)
+    yield "\nUsage Examples:"
+    yield "  vibe --provider ollama --model devstral"
+    yield "  vibe --provider vllm --api-base http://localhost:8000/v1"
+    yield "  vibe --provider openai --model gpt-4o"
 
 
 def create_provider_config_from_preset(
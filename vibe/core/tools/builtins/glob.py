@@ -5,8 +5,16 @@ This tool allows the LLM to find files matching glob patterns.
 
 from __future__ import annotations
 
-import fnmatch
+from collections import deque
+from collections.abc import Generator
+from concurrent.futures import Future
+from contextlib import closing
+from functools import cached_property, lru_cache
+from operator import itemgetter
+import os
 from pathlib import Path
+import re
+import stat
 from typing import TYPE_CHECKING, ClassVar, final
 
 from pydantic import BaseModel, Field
@@ -18,6 +26,13 @@ from vibe.core.tools.base import (
     ToolError,
     ToolPermission,
 )
+from vibe.core.tools.fs import (
+    SCAN_EXECUTOR,
+    SCAN_WORKERS,
+    ExcludeMatcher,
+    format_size,
+    has_wildcard,
+)
 from vibe.core.tools.ui import ToolCallDisplay, ToolResultDisplay, ToolUIData
 
 if TYPE_CHECKING:
@@ -49,6 +64,14 @@ class GlobMatch(BaseModel):
     size: int | None = None  # None for directories
 
 
+# (sort key, path, name, is_dir, size) collected before building GlobMatch models
+_RawMatch = tuple[str, str, str, bool, int | None]
+
+_MAX_DISPLAYED_MATCHES = 50
+_DIR_PREFIX = "\U0001f4c1 "
+_FILE_PREFIX = "\U0001f4c4 "
+
+
 class GlobResult(BaseModel):
     """Result of glob search."""
 
@@ -91,6 +114,10 @@ class GlobToolConfig(BaseToolConfig):
         description="Patterns to exclude from search results.",
     )
 
+    @cached_property
+    def exclude_matcher(self) -> ExcludeMatcher:
+        return ExcludeMatcher(self.exclude_patterns)
+
 
 class GlobState(BaseToolState):
     """State for glob tool."""
@@ -125,7 +152,11 @@ class Glob(
         matches = self._find_matches(base_path, args.pattern, args.include_hidden)
 
         was_truncated = len(matches) > self.config.max_matches
-        truncated_matches = matches[: self.config.max_matches]
+        # Values come straight from os.scandir, so skip pydantic validation
+        truncated_matches = [
+            GlobMatch.model_construct(path=path, name=name, is_dir=is_dir, size=size)
+            for _, path, name, is_dir, size in matches[: self.config.max_matches]
+        ]
 
         return GlobResult(
             matches=truncated_matches,
@@ -137,91 +168,150 @@ class Glob(
 
     def _resolve_path(self, path: str) -> Path:
         """Resolve the path relative to workdir."""
+        workdir = self.config.effective_workdir
+        if path in {"", "."} and workdir.is_absolute():
+            return workdir
+
         p = Path(path).expanduser()
         if not p.is_absolute():
-            p = self.config.effective_workdir / p
-        return p.resolve()
+            p = workdir / p
+        # Path() already drops "." and duplicate separators; resolve() walks every
+        # ancestor with a syscall, so only use it when ".." has to be collapsed
+        if ".." in p.parts or not p.is_absolute():
+            return p.resolve()
+        return p
 
     def _validate_path(self, path: Path) -> None:
         """Validate the base path exists and is a directory."""
-        if not path.exists():
-            raise ToolError(f"Path does not exist: {path}")
-        if not path.is_dir():
+        try:
+            st = os.stat(path)
+        except OSError:
+            raise ToolError(f"Path does not exist: {path}") from None
+        if not stat.S_ISDIR(st.st_mode):
             raise ToolError(f"Path is not a directory: {path}")
 
-    def _should_exclude(self, path: Path, include_hidden: bool) -> bool:
-        """Check if a path should be excluded."""
-        name = path.name
-
+    def _should_exclude(self, name: str, include_hidden: bool) -> bool:
+        """Check if a file or directory name should be excluded."""
         # Skip hidden files/dirs unless requested
         if not include_hidden and name.startswith("."):
             return True
 
-        # Check exclude patterns
-        for pattern in self.config.exclude_patterns:
-            if fnmatch.fnmatch(name, pattern):
-                return True
+        return self.config.exclude_matcher.matches(name)
+
+    def _iter_entries(
+        self, base_path: Path, prefix: str, max_depth: int | None, include_hidden: bool
+    ) -> Generator[tuple[str, os.DirEntry[str], bool], None, None]:
+        """Walk base_path with os.scandir, yielding (rel_path, entry, is_dir).
+
+        rel_path is relative to base_path and uses "/" separators. The walk
+        starts at the "/"-terminated relative directory prefix, which is held to
+        the same exclusion rules as the directories below it. Symlinks in the
+        prefix are followed: a literal prefix cannot loop.
+        Directories are walked breadth-first. Upcoming directories are listed
+        ahead on the shared executor, at most SCAN_WORKERS at a time, and more
+        are submitted as the walk consumes them; closing the walk cancels
+        listings not yet started. Excluded entries are dropped before
+        they are yielded, so excluded directories are never opened. Directories
+        deeper than max_depth (None for unlimited) are not opened either.
+        Symlinked directories are followed when max_depth bounds the walk; with
+        no bound (a "**" pattern) they are reported but not descended into, so
+        symlink cycles cannot recurse forever.
+        """
+        start = str(base_path)
+        depth = 0
+        for name in prefix.split("/")[:-1]:
+            start = os.path.join(start, name)
+            depth += 1
+            if self._should_exclude(name, include_hidden):
+                return
+
+        # Exclusion depends only on the entry name, and names such as __init__.py
+        # or src repeat across directories, so decide each name once per walk
+        excluded: dict[str, bool] = {}
+        follow_symlinks = max_depth is not None
+        # Directories still to list, in breadth-first order: (path, rel_prefix,
+        # depth of their entries)
+        queue: deque[tuple[str, str, int]] = deque([(start, prefix, depth + 1)])
+        with closing(_iter_listings(queue)) as listings:
+            for entries, rel_prefix, depth in listings:
+                descend_further = max_depth is None or depth < max_depth
+                for entry in entries:
+                    skip = excluded.get(entry.name)
+                    if skip is None:
+                        skip = self._should_exclude(entry.name, include_hidden)
+                        excluded[entry.name] = skip
+                    if skip:
+                        continue
+
+                    rel_path = rel_prefix + entry.name
+                    try:
+                        is_dir = entry.is_dir()
+                        descend = is_dir and (follow_symlinks or not entry.is_symlink())
+                    except OSError:
+                        continue
+
+                    yield rel_path, entry, is_dir
 
-        return False
+                    if descend and descend_further:
+                        queue.append((entry.path, rel_path + "/", depth + 1))
 
     def _find_matches(
         self, base_path: Path, pattern: str, include_hidden: bool
-    ) -> list[GlobMatch]:
-        """Find all files matching the pattern."""
-        matches: list[GlobMatch] = []
+    ) -> list[_RawMatch]:
+        """Find files matching the pattern, directories first, then by path.
+
+        Stops after max_matches + 1 hits: one past the cap is enough for the
+        caller to report truncation.
+        """
+        # Directories and files are collected and sorted separately
+        dirs: list[_RawMatch] = []
+        files: list[_RawMatch] = []
+        limit = self.config.max_matches + 1
+
+        # Matches are reported relative to workdir when base_path lies inside it
+        try:
+            base_rel = base_path.relative_to(self.config.effective_workdir)
+        except ValueError:
+            base_rel = base_path
+        output_prefix = "" if base_rel == Path() else os.path.join(base_rel, "")
+        native_sep = os.sep != "/"
 
         try:
-            # Use rglob for ** patterns, glob otherwise
-            if "**" in pattern:
-                iterator = base_path.glob(pattern)
-            else:
-                iterator = base_path.glob(pattern)
-
-            for path in iterator:
-                # Check exclusions on each path component
-                skip = False
-                for part in path.relative_to(base_path).parts:
-                    test_path = Path(part)
-                    if self._should_exclude(test_path, include_hidden):
-                        skip = True
-                        break
-
-                if skip:
+            regex, prefix, max_depth, dirs_only = _compile_glob(pattern)
+
+            entries = self._iter_entries(base_path, prefix, max_depth, include_hidden)
+            for rel_path, entry, is_dir in entries:
+                if (dirs_only and not is_dir) or not regex.match(rel_path):
                     continue
 
                 try:
-                    is_dir = path.is_dir()
-                    size = None if is_dir else path.stat().st_size
-
-                    # Get relative path for cleaner output
-                    try:
-                        rel_path = path.relative_to(self.config.effective_workdir)
-                    except ValueError:
-                        rel_path = path
-
-                    matches.append(
-                        GlobMatch(
-                            path=str(rel_path),
-                            name=path.name,
-                            is_dir=is_dir,
-                            size=size,
-                        )
-                    )
+                    size = None if is_dir else entry.stat().st_size
+
+                    if native_sep:
+                        rel_path = rel_path.replace("/", os.sep)
+                    match_path = output_prefix + rel_path
+                    (dirs if is_dir else files).append((
+                        match_path.lower(),
+                        match_path,
+                        entry.name,
+                        is_dir,
+                        size,
+                    ))
                 except (OSError, PermissionError):
                     # Skip files we can't access
                     continue
 
-                # Early exit if we have way too many matches
-                if len(matches) > self.config.max_matches * 2:
+                if len(dirs) + len(files) >= limit:
                     break
+            # Cancels directory listings queued past the cap
+            entries.close()
 
         except Exception as exc:
             raise ToolError(f"Error searching with pattern '{pattern}': {exc}") from exc
 
-        # Sort: directories first, then by path
-        matches.sort(key=lambda m: (not m.is_dir, m.path.lower()))
-
-        return matches
+        dirs.sort(key=itemgetter(0))
+        files.sort(key=itemgetter(0))
+        return dirs + files
 
     @classmethod
     def get_call_display(cls, event: ToolCallEvent) -> ToolCallDisplay:
@@ -255,15 +345,20 @@ class Glob(
         if result.was_truncated:
             message += f" (showing first {len(result.matches)})"
 
-        # Format matches for display
-        match_lines = []
-        for m in result.matches[:50]:  # Limit display
-            prefix = "\ud83d\udcc1 " if m.is_dir else "\ud83d\udcc4 "
-            size_str = f" ({_format_size(m.size)})" if m.size is not None else ""
-            match_lines.append(f"{prefix}{m.path}{size_str}")
+        # Format matches for display; matches are ordered directories first
+        shown = result.matches[:_MAX_DISPLAYED_MATCHES]
+        match_lines = [f"{_DIR_PREFIX}{m.path}" for m in shown if m.is_dir]
+        match_lines.extend(
+            f"{_FILE_PREFIX}{m.path} ({format_size(m.size)})"
+            if m.size is not None
+            else f"{_FILE_PREFIX}{m.path}"
+            for m in shown
+            if not m.is_dir
+        )
 
-        if len(result.matches) > 50:
-            match_lines.append(f"... and {len(result.matches) - 50} more")
+        hidden_count = len(result.matches) - len(shown)
+        if hidden_count > 0:
+            match_lines.append(f"... and {hidden_count} more")
 
         return ToolResultDisplay(
             success=True,
@@ -280,10 +375,168 @@ class Glob(
         return "Finding files"
 
 
-def _format_size(size: int) -> str:
-    """Format file size in human-readable form."""
-    for unit in ["B", "KB", "MB", "GB"]:
-        if size < 1024:
-            return f"{size:.1f}{unit}" if unit != "B" else f"{size}{unit}"
-        size /= 1024
-    return f"{size:.1f}TB"
+def _iter_listings(
+    queue: deque[tuple[str, str, int]],
+) -> Generator[tuple[list[os.DirEntry[str]], str, int], None, None]:
+    """List queued (path, rel_prefix, depth) directories in order.
+
+    Up to SCAN_WORKERS listings run ahead on the shared executor. The caller
+    may append to queue while iterating; closing the generator cancels the
+    listings not yet started.
+    """
+    in_flight: deque[tuple[Future[list[os.DirEntry[str]]], str, int]] = deque()
+    try:
+        while queue or in_flight:
+            while queue and len(in_flight) < SCAN_WORKERS:
+                path, rel_prefix, depth = queue.popleft()
+                in_flight.append((
+                    SCAN_EXECUTOR.submit(_scan_dir, path),
+                    rel_prefix,
+                    depth,
+                ))
+
+            future, rel_prefix, depth = in_flight.popleft()
+            yield future.result(), rel_prefix, depth
+    finally:
+        for future, _, _ in in_flight:
+            future.cancel()
+
+
+def _scan_dir(path: str) -> list[os.DirEntry[str]]:
+    try:
+        with os.scandir(path) as it:
+            return list(it)
+    except OSError:
+        # Skip directories we can't access
+        return []
+
+
+# Match case-insensitively where the filesystem does, as pathlib does on Windows
+_CASE_FLAGS = re.IGNORECASE if os.path.normcase("A") == "a" else 0
+
+
+def _translate_segment(segment: str) -> str:
+    """Translate one glob path segment to a regex that never crosses "/".
+
+    Bracket expressions follow fnmatch.translate: "!" negates, reversed ranges
+    such as "z-a" match nothing, and "&", "~" and "|" are escaped so they are
+    never read as regex set operations.
+    """
+    out: list[str] = []
+    i, n = 0, len(segment)
+    while i < n:
+        c = segment[i]
+        i += 1
+        if c == "*":
+            out.append("[^/]*")
+        elif c == "?":
+            out.append("[^/]")
+        elif c == "[":
+            j = i
+            if j < n and segment[j] == "!":
+                j += 1
+            if j < n and segment[j] == "]":
+                j += 1
+            while j < n and segment[j] != "]":
+                j += 1
+            if j >= n:
+                out.append("\\[")
+            else:
+                out.append(_translate_bracket(segment[i:j]))
+                i = j + 1
+        else:
+            out.append(re.escape(c))
+    return "".join(out)
+
+
+def _translate_bracket(body: str) -> str:
+    """Translate the body of a "[...]" glob expression to a regex."""
+    if "-" not in body:
+        stuff = body.replace("\\", "\\\\")
+    else:
+        # Split on range hyphens, keeping a leading "!" and "]" with the first chunk
+        chunks: list[str] = []
+        start = 0
+        k = 2 if body.startswith("!") else 1
+        while (k := body.find("-", k)) >= 0:
+            chunks.append(body[start:k])
+            start = k + 1
+            k += 3
+        if chunk := body[start:]:
+            chunks.append(chunk)
+        else:
+            chunks[-1] += "-"
+        # Drop reversed ranges such as "z-a", which re rejects
+        for k in range(len(chunks) - 1, 0, -1):
+            if chunks[k - 1][-1] > chunks[k][0]:
+                chunks[k - 1] = chunks[k - 1][:-1] + chunks[k][1:]
+                del chunks[k]
+        # Hyphens left inside chunks are literal; only the joins form ranges
+        stuff = "-".join(
+            s.replace("\\", "\\\\").replace("-", "\\-") for s in chunks
+        )
+    # Escape set operations (&&, ~~ and ||)
+    stuff = re.sub(r"([&~|])", r"\\\1", stuff)
+
+    if not stuff:
+        # Empty range: never match
+        return "(?!)"
+    if stuff == "!":
+        # Negated empty range: any character within the segment
+        return "[^/]"
+    if stuff[0] == "!":
+        # A leading "]" stays literal, so "/" goes last
+        return f"[^{stuff[1:]}/]"
+    if stuff[0] in "^[":
+        stuff = "\\" + stuff
+    # A range such as "+-0" spans "/", which must stay a separator
+    return f"(?!/)[{stuff}]" if "-" in body else f"[{stuff}]"
+
+
+@lru_cache(maxsize=128)
+def _compile_glob(pattern: str) -> tuple[re.Pattern[str], str, int | None, bool]:
+    """Compile a glob pattern into a regex over "/"-separated relative paths.
+
+    Returns:
+        Tuple of (regex, prefix, max_depth, dirs_only). prefix is the run of
+        leading literal directories (e.g. "src/" for "src/**/*.py"), so the walk
+        can start there. max_depth is the number of path segments the pattern
+        can match, or None when it contains "**". dirs_only is set for patterns
+        ending in "/" or "**".
+    """
+    if not pattern:
+        raise ValueError("Unacceptable pattern: empty")
+    if pattern.startswith("/"):
+        raise ValueError("Non-relative patterns are unsupported")
+
+    dirs_only = pattern.endswith("/")
+    segments: list[str] = []
+    for seg in pattern.split("/"):
+        if not seg or seg == "." or (seg == "**" and segments[-1:] == ["**"]):
+            continue
+        segments.append(seg)
+    if not segments:
+        raise ValueError(f"Unacceptable pattern: {pattern!r}")
+
+    parts: list[str] = []
+    prefix: list[str] = []
+    last = len(segments) - 1
+    for i, segment in enumerate(segments):
+        if segment == "**":
+            if i == last:
+                # Trailing "**" matches the directory itself and every directory below
+                dirs_only = True
+                parts.append("[^/]+(?:/[^/]+)*" if i == 0 else "(?:/[^/]+)*")
+            else:
+                parts.append("(?:[^/]+/)*")
+        else:
+            parts.append(_translate_segment(segment))
+            # A trailing "**" brings its own leading separator
+            if i < last and not (i + 1 == last and segments[last] == "**"):
+                parts.append("/")
+                if len(prefix) == i and not has_wildcard(segment):
+                    prefix.append(f"{segment}/")
+
+    max_depth = None if "**" in segments else len(segments)
+    regex = re.compile("".join(parts) + r"\Z", _CASE_FLAGS)
+    return regex, "".join(prefix), max_depth, dirs_only
@@ -5,8 +5,14 @@ This tool allows the LLM to see the contents of a directory with metadata.
 
 from __future__ import annotations
 
-import fnmatch
+from collections import deque
+from collections.abc import Generator, Iterator
+from concurrent.futures import Future
 from datetime import datetime, timezone
+from functools import cached_property
+import heapq
+from itertools import islice
+import os
 from pathlib import Path
 from typing import TYPE_CHECKING, ClassVar, final
 
@@ -19,12 +25,16 @@ from vibe.core.tools.base import (
     ToolError,
     ToolPermission,
 )
+from vibe.core.tools.fs import SCAN_EXECUTOR, SCAN_WORKERS, ExcludeMatcher, format_size
 from vibe.core.tools.ui import ToolCallDisplay, ToolResultDisplay, ToolUIData
 
 if TYPE_CHECKING:
     from vibe.core.types import ToolCallEvent, ToolResultEvent
 
 
+_MAX_RECENTLY_LISTED = 10
+
+
 class ListDirectoryArgs(BaseModel):
     """Arguments for listing directory contents."""
 
@@ -44,6 +54,13 @@ class ListDirectoryArgs(BaseModel):
         default=2,
         description="Maximum depth for recursive listing (only used if recursive=True).",
     )
+    count_children: bool = Field(
+        default=False,
+        description=(
+            "Report the number of items in each subdirectory "
+            "(only used if recursive=False)."
+        ),
+    )
 
 
 class DirectoryEntry(BaseModel):
@@ -57,6 +74,11 @@ class DirectoryEntry(BaseModel):
     children_count: int | None = None  # For directories: number of children
 
 
+# (name, path, is_dir, size, mtime, children_count) collected before building
+# DirectoryEntry models
+_RawEntry = tuple[str, str, bool, int | None, float, int | None]
+
+
 class ListDirectoryResult(BaseModel):
     """Result of directory listing."""
 
@@ -86,11 +108,17 @@ class ListDirectoryConfig(BaseToolConfig):
         description="Patterns to exclude from listing.",
     )
 
+    @cached_property
+    def exclude_matcher(self) -> ExcludeMatcher:
+        return ExcludeMatcher(self.exclude_patterns)
+
 
 class ListDirectoryState(BaseToolState):
     """State for list_directory tool."""
 
-    recently_listed: list[str] = Field(default_factory=list)
+    recently_listed: deque[str] = Field(
+        default_factory=lambda: deque(maxlen=_MAX_RECENTLY_LISTED)
+    )
 
 
 class ListDirectory(
@@ -113,23 +141,45 @@ class ListDirectory(
         dir_path = self._resolve_path(args.path)
         self._validate_path(dir_path)
 
-        # Track in state
+        # Track in state; the deque drops the oldest path once full
         self.state.recently_listed.append(str(dir_path))
-        if len(self.state.recently_listed) > 10:
-            self.state.recently_listed.pop(0)
 
-        entries = self._list_entries(
-            dir_path,
+        # Entries under workdir are reported relative to it
+        workdir_prefix = os.path.join(self.config.effective_workdir, "")
+        # Entries are produced lazily, so stop one past the cap: enough to
+        # report truncation without statting the rest of the tree
+        limit = self.config.max_entries + 1
+        entries_iter = self._iter_entries(
+            str(dir_path),
+            workdir_prefix,
             args.include_hidden,
-            args.recursive,
-            args.max_depth,
-            current_depth=0,
+            args.max_depth if args.recursive else 0,
+            limit,
+            # A recursive listing already shows each directory's children
+            count_children=args.count_children and not args.recursive,
         )
+        entries = list(islice(entries_iter, limit))
+        # Cancels subdirectory listings queued past the cap
+        entries_iter.close()
 
         was_truncated = len(entries) > self.config.max_entries
-        truncated_entries = entries[: self.config.max_entries]
+        # Values come straight from os.scandir, so skip pydantic validation
+        truncated_entries = [
+            DirectoryEntry.model_construct(
+                name=name,
+                path=path,
+                is_dir=is_dir,
+                size=size,
+                modified=datetime.fromtimestamp(mtime, tz=timezone.utc).isoformat(),
+                children_count=children_count,
+            )
+            for name, path, is_dir, size, mtime, children_count in entries[
+                : self.config.max_entries
+            ]
+        ]
 
-        return ListDirectoryResult(
+        # Every field is built above, so the result needs no validation either
+        return ListDirectoryResult.model_construct(
             path=str(dir_path),
             entries=truncated_entries,
             total_entries=len(entries),
@@ -155,81 +205,120 @@ class ListDirectory(
         if not include_hidden and name.startswith("."):
             return True
 
-        for pattern in self.config.exclude_patterns:
-            if fnmatch.fnmatch(name, pattern):
-                return True
+        return self.config.exclude_matcher.matches(name)
 
-        return False
+    def _scan_dir(
+        self, dir_path: str, include_hidden: bool, limit: int
+    ) -> list[os.DirEntry[str]]:
+        """Read a directory's first `limit` non-excluded entries in display order.
 
-    def _list_entries(
+        Entries are ordered directories first, then by name. Only the first
+        `limit` are kept, so huge directories are heap-selected rather than
+        fully sorted.
+        """
+        try:
+            with os.scandir(dir_path) as it:
+                return heapq.nsmallest(
+                    limit,
+                    (e for e in it if not self._should_exclude(e.name, include_hidden)),
+                    key=_sort_key,
+                )
+        except OSError:
+            # Skip directories we can't read
+            return []
+
+    def _iter_entries(
         self,
-        dir_path: Path,
+        dir_path: str,
+        workdir_prefix: str,
         include_hidden: bool,
-        recursive: bool,
         max_depth: int,
-        current_depth: int,
-    ) -> list[DirectoryEntry]:
-        """List directory entries."""
-        entries: list[DirectoryEntry] = []
+        limit: int,
+        count_children: bool = False,
+    ) -> Generator[_RawEntry, None, None]:
+        """Yield directory entries, directories first, depth-first.
+
+        Subdirectories are descended into while their depth is below max_depth
+        (0 lists dir_path only). The walk keeps an explicit stack of the
+        directories being listed instead of recursing. Callers take at most
+        `limit` entries, so no directory needs more than its first `limit`
+        in sorted order. Entries are only stat-ed as they are yielded.
+
+        Upcoming subdirectories are listed ahead on the shared executor, at
+        most SCAN_WORKERS at a time, and more are submitted as the walk
+        consumes them. The walk may stop before reaching some of those, so up
+        to SCAN_WORKERS directories can be opened without being listed.
+        Closing the walk cancels listings not yet started.
+        """
+        # Listings submitted ahead of the walk, keyed by directory path
+        pending: dict[str, Future[list[os.DirEntry[str]]]] = {}
+        # Per directory being listed: its entries, depth, and the subdirectories
+        # the walk may descend into that have not been submitted yet
+        stack: list[
+            tuple[Iterator[os.DirEntry[str]], int, deque[os.DirEntry[str]]]
+        ] = []
+        emitted = 0
+
+        def push(listing: list[os.DirEntry[str]], depth: int) -> None:
+            upcoming: deque[os.DirEntry[str]] = deque()
+            if depth < max_depth:
+                # Entries past the remaining budget can never be reached
+                upcoming.extend(
+                    e for e in islice(listing, limit - emitted) if _is_dir(e)
+                )
+            stack.append((iter(listing), depth, upcoming))
 
+        push(self._scan_dir(dir_path, include_hidden, limit), 0)
         try:
-            items = sorted(dir_path.iterdir(), key=lambda p: (not p.is_dir(), p.name.lower()))
-        except PermissionError:
-            return entries
-
-        for item in items:
-            if self._should_exclude(item.name, include_hidden):
-                continue
+            while stack:
+                items, depth, upcoming = stack[-1]
+                # Keep the next few subdirectories of the current one in flight
+                while upcoming and len(pending) < SCAN_WORKERS:
+                    sub = upcoming.popleft()
+                    pending[sub.path] = SCAN_EXECUTOR.submit(
+                        self._scan_dir, sub.path, include_hidden, limit
+                    )
 
-            try:
-                stat = item.stat()
-                is_dir = item.is_dir()
+                item = next(items, None)
+                if item is None:
+                    stack.pop()
+                    continue
 
-                # Get relative path
                 try:
-                    rel_path = item.relative_to(self.config.effective_workdir)
-                except ValueError:
-                    rel_path = item
-
-                # Count children for directories
-                children_count = None
-                if is_dir:
-                    try:
-                        children_count = sum(1 for _ in item.iterdir())
-                    except PermissionError:
-                        children_count = None
-
-                entry = DirectoryEntry(
-                    name=item.name,
-                    path=str(rel_path),
-                    is_dir=is_dir,
-                    size=None if is_dir else stat.st_size,
-                    modified=datetime.fromtimestamp(
-                        stat.st_mtime, tz=timezone.utc
-                    ).isoformat(),
-                    children_count=children_count,
-                )
-                entries.append(entry)
-
-                # Recurse into subdirectories
-                if is_dir and recursive and current_depth < max_depth:
-                    sub_entries = self._list_entries(
-                        item,
-                        include_hidden,
-                        recursive,
-                        max_depth,
-                        current_depth + 1,
-                    )
-                    entries.extend(sub_entries)
-
-                # Safety limit
-                if len(entries) > self.config.max_entries * 2:
-                    break
+                    # is_dir() comes from the readdir data; stat() is cached on the entry
+                    stat = item.stat()
+                    is_dir = item.is_dir()
 
-            except (OSError, PermissionError):
-                continue
+                    # Count children for directories
+                    children_count = (
+                        _count_children(item.path) if is_dir and count_children else None
+                    )
+                except OSError:
+                    continue
+
+                emitted += 1
+                yield (
+                    item.name,
+                    item.path.removeprefix(workdir_prefix),
+                    is_dir,
+                    None if is_dir else stat.st_size,
+                    stat.st_mtime,
+                    children_count,
+                )
 
-        return entries
+                # Descend before moving on to the next sibling
+                if is_dir and depth < max_depth:
+                    future = pending.pop(item.path, None)
+                    if future is not None:
+                        listing = future.result()
+                    else:
+                        # Not submitted yet, so it must not be read ahead later
+                        _drop_through(upcoming, item.path)
+                        listing = self._scan_dir(item.path, include_hidden, limit)
+                    push(listing, depth + 1)
+        finally:
+            for future in pending.values():
+                future.cancel()
 
     @classmethod
     def get_call_display(cls, event: ToolCallEvent) -> ToolCallDisplay:
@@ -270,7 +359,7 @@ class ListDirectory(
                 child_info = f" ({e.children_count} items)" if e.children_count is not None else ""
                 lines.append(f"\ud83d\udcc1 {e.path}/{child_info}")
             else:
-                size_str = _format_size(e.size) if e.size is not None else "?"
+                size_str = format_size(e.size) if e.size is not None else "?"
                 lines.append(f"\ud83d\udcc4 {e.path} ({size_str})")
 
         if len(result.entries) > 30:
@@ -291,10 +380,30 @@ class ListDirectory(
         return "Listing directory"
 
 
-def _format_size(size: int) -> str:
-    """Format file size in human-readable form."""
-    for unit in ["B", "KB", "MB", "GB"]:
-        if size < 1024:
-            return f"{size:.1f}{unit}" if unit != "B" else f"{size}{unit}"
-        size /= 1024
-    return f"{size:.1f}TB"
+def _is_dir(entry: os.DirEntry[str]) -> bool:
+    try:
+        return entry.is_dir()
+    except OSError:
+        return False
+
+
+def _sort_key(entry: os.DirEntry[str]) -> tuple[bool, str]:
+    """Sort directories first, then by case-insensitive name."""
+    return (not _is_dir(entry), entry.name.lower())
+
+
+def _drop_through(queue: deque[os.DirEntry[str]], path: str) -> None:
+    """Drop queued entries up to and including the one at path.
+
+    Entries before it were skipped on a stat error and will not be reached.
+    """
+    while queue and queue.popleft().path != path:
+        pass
+
+
+def _count_children(dir_path: str) -> int | None:
+    try:
+        with os.scandir(dir_path) as it:
+            return sum(1 for _ in it)
+    except PermissionError:
+        return None
@@ -0,0 +1,66 @@
+"""Filesystem helpers shared by the builtin file tools."""
+
+from __future__ import annotations
+
+import atexit
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+import fnmatch
+from functools import lru_cache
+import os
+import re
+
+# Size of the directory scan pool
+SCAN_WORKERS = min(8, os.cpu_count() or 1)
+
+# os.scandir releases the GIL, so directories are listed concurrently here
+SCAN_EXECUTOR = ThreadPoolExecutor(
+    max_workers=SCAN_WORKERS, thread_name_prefix="fs-scan"
+)
+atexit.register(SCAN_EXECUTOR.shutdown)
+
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+
+def has_wildcard(pattern: str) -> bool:
+    return any(c in pattern for c in "*?[")
+
+
+class ExcludeMatcher:
+    """Matches entry names against fnmatch-style exclude patterns.
+
+    Patterns without wildcards are matched by exact name with a set lookup;
+    the rest are fused into a single regex.
+    """
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        literals: set[str] = set()
+        wildcards: list[str] = []
+        for pattern in patterns:
+            if has_wildcard(pattern):
+                wildcards.append(pattern)
+            else:
+                literals.add(pattern)
+
+        self._literals = frozenset(literals)
+        self._wildcard_re = (
+            re.compile("|".join(fnmatch.translate(p) for p in wildcards))
+            if wildcards
+            else None
+        )
+
+    def matches(self, name: str) -> bool:
+        if name in self._literals:
+            return True
+        wildcard_re = self._wildcard_re
+        return wildcard_re is not None and wildcard_re.match(name) is not None
+
+
+@lru_cache(maxsize=1024)
+def format_size(size: int) -> str:
+    """Format file size in human-readable form."""
+    # Each unit is 2**10 of the previous one, so the bit length picks the unit
+    unit = min((size.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    if unit <= 0:
+        return f"{size}B"
+    return f"{size / (1 << (unit * 10)):.1f}{_SIZE_UNITS[unit]}"
@@ -65,6 +65,18 @@ class AgentStats(BaseModel):
         ) * self.output_price_per_million
         return input_cost + output_cost
 
+    @computed_field
+    @property
+    def last_turn_cost(self) -> float:
+        """Estimated cost of the last turn in dollars, priced like session_cost."""
+        input_cost = (
+            self.last_turn_prompt_tokens / 1_000_000
+        ) * self.input_price_per_million
+        output_cost = (
+            self.last_turn_completion_tokens / 1_000_000
+        ) * self.output_price_per_million
+        return input_cost + output_cost
+
     def update_pricing(self, input_price: float, output_price: float) -> None:
         """Update pricing info when model changes.
 
@@ -27,6 +27,10 @@ CONFIG_DOCS_URL = (
     "https://github.com/mistralai/mistral-vibe?tab=readme-ov-file#configuration"
 )
 
+# Class sets cleared on every keystroke in the API key input
+_CLEAR_INPUT_CLASSES = ("valid", "invalid")
+_CLEAR_FEEDBACK_CLASSES = ("error", "success")
+
 
 def _save_api_key_to_env_file(env_key: str, api_key: str) -> None:
     GLOBAL_ENV_FILE.path.parent.mkdir(parents=True, exist_ok=True)
@@ -146,19 +150,21 @@ class ApiKeyScreen(OnboardingScreen):
     def on_mount(self) -> None:
         # For local providers, we have no input widget
         if hasattr(self, "input_widget"):
+            # Cached so per-keystroke handlers don't re-query the DOM
+            self._feedback = self.query_one("#feedback", Static)
+            self._input_box = self.query_one("#input-box")
             self.input_widget.focus()
         else:
             self.focus()
 
     def on_input_changed(self, event: Input.Changed) -> None:
-        feedback = self.query_one("#feedback", Static)
-        input_box = self.query_one("#input-box")
-
         if event.validation_result is None:
             return
 
-        input_box.remove_class("valid", "invalid")
-        feedback.remove_class("error", "success")
+        feedback = self._feedback
+        input_box = self._input_box
+        input_box.remove_class(*_CLEAR_INPUT_CLASSES)
+        feedback.remove_class(*_CLEAR_FEEDBACK_CLASSES)
 
         if event.validation_result.is_valid:
             feedback.update("Press Enter to submit \u21b5")
@@ -183,12 +189,12 @@ class ApiKeyScreen(OnboardingScreen):
 
     def _validate_and_save(self, api_key: str) -> None:
         """Validate API key and save if valid."""
-        feedback = self.query_one("#feedback", Static)
-        input_box = self.query_one("#input-box")
+        feedback = self._feedback
+        input_box = self._input_box
 
         # Clear previous feedback
         feedback.update("")
-        feedback.remove_class("error", "success")
+        feedback.remove_class(*_CLEAR_FEEDBACK_CLASSES)
 
         # Show validation in progress
         feedback.update("Validating API key...")
@@ -312,13 +318,12 @@ class ApiKeyScreen(OnboardingScreen):
             return
 
         api_key = self.input_widget.value.strip()
+        feedback = self._feedback
         if not api_key:
-            feedback = self.query_one("#feedback", Static)
             feedback.update("Please enter an API key first")
             feedback.add_class("error")
             return
 
-        feedback = self.query_one("#feedback", Static)
         feedback.update("Skipping validation...")
         feedback.add_class("success")
         self._save_and_finish(api_key)
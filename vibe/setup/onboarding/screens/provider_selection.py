@@ -15,6 +15,15 @@ from vibe.setup.onboarding.base import OnboardingScreen
 LOCAL_PROVIDERS = ["ollama", "llamacpp", "vllm", "localai", "lmstudio"]
 REMOTE_PROVIDERS = ["mistral", "openai", "openrouter", "together", "groq"]
 
+# Resolved once at import; a name missing from PROVIDER_PRESETS fails here
+# rather than leaving a silently empty button row.
+REMOTE_PRESETS: tuple[ProviderPreset, ...] = tuple(
+    PROVIDER_PRESETS[name] for name in REMOTE_PROVIDERS
+)
+LOCAL_PRESETS: tuple[ProviderPreset, ...] = tuple(
+    PROVIDER_PRESETS[name] for name in LOCAL_PROVIDERS
+)
+
 
 class ProviderButton(Button):
     """A button representing a provider choice."""
@@ -39,6 +48,7 @@ class ProviderSelectionScreen(OnboardingScreen):
     def __init__(self) -> None:
         super().__init__()
         self.selected_provider: str = "mistral"
+        self._selected_button: ProviderButton | None = None
 
     def compose(self) -> ComposeResult:
         with Vertical(id="provider-outer"):
@@ -51,29 +61,25 @@ class ProviderSelectionScreen(OnboardingScreen):
                     # Remote providers (cloud APIs)
                     yield Static("[bold]Cloud Providers[/]", classes="provider-section-title")
                     with Horizontal(classes="provider-row"):
-                        for name in REMOTE_PROVIDERS[:3]:
-                            if preset := PROVIDER_PRESETS.get(name):
-                                btn = ProviderButton(preset, classes="provider-btn")
-                                if name == "mistral":
-                                    btn.add_class("selected")
-                                yield btn
+                        for preset in REMOTE_PRESETS[:3]:
+                            btn = ProviderButton(preset, classes="provider-btn")
+                            if preset.name == "mistral":
+                                btn.add_class("selected")
+                            yield btn
                     with Horizontal(classes="provider-row"):
-                        for name in REMOTE_PROVIDERS[3:]:
-                            if preset := PROVIDER_PRESETS.get(name):
-                                yield ProviderButton(preset, classes="provider-btn")
+                        for preset in REMOTE_PRESETS[3:]:
+                            yield ProviderButton(preset, classes="provider-btn")
 
                     yield Static("", classes="spacer-small")
 
                     # Local providers
                     yield Static("[bold]Local Providers[/]", classes="provider-section-title")
                     with Horizontal(classes="provider-row"):
-                        for name in LOCAL_PROVIDERS[:3]:
-                            if preset := PROVIDER_PRESETS.get(name):
-                                yield ProviderButton(preset, classes="provider-btn")
+                        for preset in LOCAL_PRESETS[:3]:
+                            yield ProviderButton(preset, classes="provider-btn")
                     with Horizontal(classes="provider-row"):
-                        for name in LOCAL_PROVIDERS[3:]:
-                            if preset := PROVIDER_PRESETS.get(name):
-                                yield ProviderButton(preset, classes="provider-btn")
+                        for preset in LOCAL_PRESETS[3:]:
+                            yield ProviderButton(preset, classes="provider-btn")
 
             yield Static("", classes="spacer-small")
             with Center():
@@ -87,9 +93,14 @@ class ProviderSelectionScreen(OnboardingScreen):
                 )
 
     def on_mount(self) -> None:
+        # Cached so focus changes don't re-query the DOM
+        self._desc_widget = self.query_one("#provider-description", Static)
+
         # Focus the first provider button (Mistral)
         first_btn = self.query_one("#provider-mistral", ProviderButton)
         first_btn.focus()
+        # compose marks Mistral as selected
+        self._selected_button = first_btn
         self._update_description(first_btn.preset)
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
@@ -101,7 +112,6 @@ class ProviderSelectionScreen(OnboardingScreen):
             self._update_description(event.button.preset)
 
     def _update_description(self, preset: ProviderPreset) -> None:
-        desc = self.query_one("#provider-description", Static)
         lines = [
             f"[bold]{preset.description}[/]",
             f"[dim]API: {preset.api_base}[/]",
@@ -110,15 +120,14 @@ class ProviderSelectionScreen(OnboardingScreen):
             lines.append(f"[dim]Requires: ${preset.api_key_env_var}[/]")
         if preset.notes:
             lines.append(f"[dim italic]{preset.notes}[/]")
-        desc.update("\n".join(lines))
+        self._desc_widget.update("\n".join(lines))
 
     def _select_provider(self, button: ProviderButton) -> None:
-        # Remove selected class from all buttons
-        for btn in self.query(ProviderButton):
-            btn.remove_class("selected")
-
-        # Add selected class to clicked button
+        # Move the selected class from the previous button to the clicked one
+        if self._selected_button is not None:
+            self._selected_button.remove_class("selected")
         button.add_class("selected")
+        self._selected_button = button
         self.selected_provider = button.preset.name
 
         # Store in app for later use